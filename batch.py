@@ -0,0 +1,364 @@
+"""
+Copyright (c) 2025 Alejandro Ramírez
+Bajo la Licencia de Autor Restringida (LAR) v1.0
+Más detalles en LICENSE
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import logging
+import argparse
+import threading
+import configparser
+import multiprocessing
+from contextlib import redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from core.checkpoint import CheckpointJournal
+from core.config import REQUIRED_KEYS, default_config_path, load_config, missing_keys
+from core.gherkinConverter import UltimateGherkinConverter
+from core.httpTransport import HttpTransport, RateLimiter
+from core.jiraExtractor import JiraExtractor
+from core.metrics import METRICS
+from core.pipeline import FeaturePipeline, jira_source_name, ve_source_name
+from core.runControl import RunCancelled, RunControl
+from core.valueEdgeExtractor import ValueEdgeExtractor
+
+logger = logging.getLogger("batch")
+
+# Códigos de salida
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_INVALID = 2
+EXIT_INTERRUPTED = 130
+
+# Ritmo por host cuando el manifiesto no lo indica
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+
+MANIFEST_EXAMPLE = """
+Ejemplo de manifiesto:
+
+  [Batch]
+  JOBS = 2              ; proyectos/workspaces procesados a la vez
+  CONCURRENCY = 8       ; solicitudes HTTP en vuelo entre todas las fuentes
+  OUTPUT_DIR = output
+  GROUP_BY_MODULE = false
+
+  [JIRA]
+  PROJECTS = BT115, PAGOS
+  MODE = all            ; all | sync
+
+  [ValueEdge]
+  WORKSPACES = 1002, 1003
+
+  [RateLimits]          ; solicitudes/s por host
+  DEFAULT = 10
+  miempresa.atlassian.net = 5
+"""
+
+class BatchError(Exception):
+    """Manifiesto o configuración inválidos"""
+
+def _split_list(value: str) -> List[str]:
+    return [item.strip() for item in value.replace("\n", ",").split(",") if item.strip()]
+
+class BatchRunner:
+    """
+    Extracción y conversión desatendida de varias fuentes
+
+    Cada proyecto de JIRA y workspace de ValueEdge es un trabajo; se ejecutan
+    hasta JOBS a la vez. Todos los transportes comparten un semáforo de
+    CONCURRENCY solicitudes en vuelo y un limitador de ritmo por host, así
+    que el total de tráfico no crece con la cantidad de fuentes.
+    """
+
+    def __init__(self, manifest: configparser.ConfigParser, config_path: str):
+        self.manifest = manifest
+        self.config_path = config_path
+        self.config = load_config(config_path)
+
+        self.jobs = manifest.getint('Batch', 'JOBS', fallback=2)
+        self.output_dir = manifest.get('Batch', 'OUTPUT_DIR', fallback="output")
+        self.checkpoint_dir = os.path.join(self.output_dir, "checkpoints")
+        self.group_by_module = manifest.getboolean('Batch', 'GROUP_BY_MODULE', fallback=False)
+        self.jira_projects = _split_list(manifest.get('JIRA', 'PROJECTS', fallback=""))
+        self.jira_mode = manifest.get('JIRA', 'MODE', fallback="all").strip().lower()
+        self.workspaces = _split_list(manifest.get('ValueEdge', 'WORKSPACES', fallback=""))
+
+        if self.jira_mode not in ("all", "sync"):
+            raise BatchError(f"[JIRA] MODE debe ser 'all' o 'sync', no '{self.jira_mode}'")
+        if not self.jira_projects and not self.workspaces:
+            raise BatchError("El manifiesto no tiene [JIRA] PROJECTS ni [ValueEdge] WORKSPACES")
+
+        # Solo se exigen las credenciales de las fuentes que aparecen en el manifiesto
+        required = {}
+        if self.jira_projects:
+            required['JIRA'] = REQUIRED_KEYS['JIRA']
+        if self.workspaces:
+            required['ValueEdge'] = REQUIRED_KEYS['ValueEdge']
+        errors = missing_keys(self.config, required)
+        if errors:
+            raise BatchError(f"{config_path}: " + "; ".join(errors))
+
+        self.slots = threading.BoundedSemaphore(
+            max(1, manifest.getint('Batch', 'CONCURRENCY', fallback=8))
+        )
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._limiters_lock = threading.Lock()
+        # Un solo control: cancelar también evita que empiecen los trabajos en cola
+        self.control = RunControl()
+
+    def limiter_for(self, url: str) -> RateLimiter:
+        """Limitador compartido por todos los transportes hacia el mismo host"""
+        host = urlsplit(url).hostname or url
+        with self._limiters_lock:
+            if host not in self._limiters:
+                rate = self.manifest.getfloat(
+                    'RateLimits', host,
+                    fallback=self.manifest.getfloat('RateLimits', 'DEFAULT', fallback=DEFAULT_REQUESTS_PER_SECOND)
+                )
+                logger.info(f"Límite para {host}: {rate:.2f} req/s")
+                self._limiters[host] = RateLimiter(rate, ceiling_per_second=rate)
+            return self._limiters[host]
+
+    def transport_for(self, url: str, verify: bool = True) -> HttpTransport:
+        return HttpTransport(verify=verify, limiter=self.limiter_for(url), slots=self.slots)
+
+    def stream_pipeline(self, features_dir: str, prefix: str, source_name, persist, input_dir: str) -> FeaturePipeline:
+        """Pipeline con un conversor propio: los trabajos corren en paralelo"""
+        if self.group_by_module:
+            return FeaturePipeline(None, source_name, persist=persist)
+        converter = UltimateGherkinConverter(output_dir=features_dir, filename_prefix=prefix)
+        return FeaturePipeline(converter, source_name, persist=persist, input_dir=input_dir)
+
+    def convert_folder(self, input_dir: str, features_dir: str, prefix: str) -> Dict[str, Any]:
+        """Conversión de la carpeta completa (agrupada por módulo o incremental)"""
+        converter = UltimateGherkinConverter()
+        if self.group_by_module:
+            return converter.convert_by_module(
+                workers=None,
+                input_dir=input_dir,
+                output_dir=os.path.join(features_dir, "modulos"),
+                filename_prefix=prefix
+            )
+        return converter.convert(
+            workers=None,
+            incremental=True,
+            input_dir=input_dir,
+            output_dir=features_dir,
+            filename_prefix=prefix
+        )
+
+    def run_jira(self, project: str, control: RunControl) -> Dict[str, Any]:
+        """Extraer y convertir un proyecto de JIRA"""
+        extractor = JiraExtractor(
+            self.config.get('JIRA', 'URL'),
+            self.config.get('JIRA', 'EMAIL'),
+            self.config.get('JIRA', 'API_TOKEN'),
+            transport=self.transport_for(self.config.get('JIRA', 'URL'))
+        )
+        if not extractor.check_connection():
+            raise RuntimeError("Falló la conexión con JIRA")
+
+        issues_root = os.path.join(self.output_dir, "jira_issues")
+        input_dir = os.path.join(issues_root, project)
+        features_dir = os.path.join(self.output_dir, "features", "jira")
+        prefix = f"JIRA_{project}_"
+        os.makedirs(input_dir, exist_ok=True)
+
+        if self.jira_mode == "sync":
+            extracted = 0
+            for _ in extractor.sync_project(project, issues_root):
+                control.checkpoint()
+                extracted += 1
+            return {"extraidos": extracted, "features": self._features(self.convert_folder(input_dir, features_dir, prefix))}
+
+        pipeline = self.stream_pipeline(
+            features_dir, prefix, jira_source_name,
+            persist=lambda issue: extractor.save_issue(issue, issues_root),
+            input_dir=input_dir
+        )
+        with pipeline:
+            extracted = extractor.export_project(
+                project, issues_root,
+                journal=CheckpointJournal.for_run("jira", project, self.checkpoint_dir),
+                sink=pipeline.submit, control=control
+            )
+        return {"extraidos": extracted, "features": self._features(self._converted(pipeline, input_dir, features_dir, prefix))}
+
+    def run_valueedge(self, workspace: str, control: RunControl) -> Dict[str, Any]:
+        """Extraer y convertir un workspace de ValueEdge"""
+        extractor = ValueEdgeExtractor(
+            self.config_path,
+            transport=self.transport_for(self.config.get('ValueEdge', 'URL'), verify=False)
+        )
+        extractor.workspace = workspace
+        if not extractor.login():
+            raise RuntimeError("Falló login en ValueEdge")
+
+        input_dir = os.path.join(self.output_dir, "test_cases", workspace)
+        features_dir = os.path.join(self.output_dir, "features", "ve")
+        prefix = f"VE_{workspace}_"
+        os.makedirs(input_dir, exist_ok=True)
+
+        pipeline = self.stream_pipeline(
+            features_dir, prefix, ve_source_name,
+            persist=lambda test_case: extractor.save_test_case(test_case, input_dir),
+            input_dir=input_dir
+        )
+        with pipeline:
+            summary = extractor.extract_all_test_cases(
+                input_dir,
+                journal=CheckpointJournal.for_run("ve", workspace, self.checkpoint_dir),
+                sink=pipeline.submit, control=control
+            )
+        return {
+            "extraidos": summary["exitosos"],
+            "fallidos": summary["fallidos"],
+            "ids_fallidos": summary["ids_fallidos"],
+            "features": self._features(self._converted(pipeline, input_dir, features_dir, prefix))
+        }
+
+    def _converted(self, pipeline: FeaturePipeline, input_dir: str, features_dir: str, prefix: str) -> Dict[str, Any]:
+        """Resumen de conversión: el del pipeline, o el de la carpeta si se agrupa por módulo"""
+        if self.group_by_module:
+            return self.convert_folder(input_dir, features_dir, prefix)
+        return pipeline.summary
+
+    @staticmethod
+    def _features(summary: Dict[str, Any]) -> Dict[str, Any]:
+        return {"generados": summary.get("generados", 0), "errores": len(summary.get("errores", []))}
+
+    def _run_job(self, source: str, name: str) -> Dict[str, Any]:
+        control = self.control
+        result = {"origen": source, "nombre": name}
+        start = time.perf_counter()
+
+        try:
+            control.checkpoint()
+            logger.info(f"Iniciando {source} {name}")
+            if source == "jira":
+                result.update(self.run_jira(name, control))
+            else:
+                result.update(self.run_valueedge(name, control))
+            failed = result.get("fallidos", 0) or result["features"]["errores"]
+            result["estado"] = "parcial" if failed else "ok"
+        except RunCancelled:
+            result["estado"] = "cancelado"
+        except Exception as e:
+            logger.error(f"Error en {source} {name}: {str(e)}")
+            result["estado"] = "error"
+            result["error"] = str(e)
+
+        result["duracion_s"] = round(time.perf_counter() - start, 3)
+        logger.info(f"Terminado {source} {name}: {result['estado']}")
+        return result
+
+    def cancel(self) -> None:
+        """Detener todos los trabajos en un punto limpio (los journals quedan consistentes)"""
+        self.control.cancel()
+
+    def run(self) -> Dict[str, Any]:
+        """Ejecutar todas las fuentes del manifiesto y devolver el resumen"""
+        METRICS.reset()
+        started = datetime.now(timezone.utc)
+        work = [("jira", project) for project in self.jira_projects]
+        work += [("ve", workspace) for workspace in self.workspaces]
+
+        with ThreadPoolExecutor(max_workers=max(1, self.jobs), thread_name_prefix="batch") as executor:
+            futures = [executor.submit(self._run_job, source, name) for source, name in work]
+            results = [future.result() for future in futures]
+
+        states = {result["estado"] for result in results}
+        return {
+            "inicio": started.isoformat(),
+            "duracion_s": round((datetime.now(timezone.utc) - started).total_seconds(), 3),
+            "estado": "ok" if states == {"ok"} else ("cancelado" if "cancelado" in states else "errores"),
+            "fuentes": results,
+            "metricas": METRICS.summary()
+        }
+
+def load_manifest(path: str) -> configparser.ConfigParser:
+    manifest = configparser.ConfigParser(inline_comment_prefixes=(";", "#"))
+    if not manifest.read(path, encoding='utf-8'):
+        raise BatchError(f"No se pudo leer el manifiesto: {path}")
+    return manifest
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Extracción y conversión desatendida de proyectos JIRA y workspaces ValueEdge",
+        epilog=MANIFEST_EXAMPLE,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("manifest", help="Archivo .ini con las fuentes a procesar")
+    parser.add_argument("--config", default=default_config_path(), help="Ruta de secrets.ini")
+    parser.add_argument("--output", help="Guardar también el resumen JSON en este archivo")
+    parser.add_argument("--verbose", action="store_true", help="Mostrar el log de los extractores")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='[%(asctime)s] %(levelname)s @ %(module)s: %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        stream=sys.stderr,
+        force=True
+    )
+    logger.setLevel(logging.INFO)
+
+    try:
+        runner = BatchRunner(load_manifest(args.manifest), args.config)
+    except (BatchError, configparser.Error, ValueError) as e:
+        print(json.dumps({"estado": "invalido", "error": str(e)}, ensure_ascii=False))
+        return EXIT_INVALID
+
+    # SIGTERM (cancelación del agente de CI) se trata igual que Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    # stdout queda reservado para el resumen; el conversor imprime su avance ahí
+    stdout = sys.stdout
+    holder: Dict[str, Optional[Dict[str, Any]]] = {"summary": None}
+    # Se espera con un Event: un join() interrumpido por la señal no es fiable
+    finished = threading.Event()
+
+    def run():
+        try:
+            holder["summary"] = runner.run()
+        except Exception as e:
+            logger.error(f"Error en la ejecución por lotes: {str(e)}")
+            holder["summary"] = {"estado": "error", "error": str(e), "fuentes": []}
+        finally:
+            finished.set()
+
+    with redirect_stdout(sys.stderr):
+        threading.Thread(target=run, name="batch-run", daemon=True).start()
+        try:
+            while not finished.wait(0.5):
+                pass
+        except KeyboardInterrupt:
+            logger.warning("Interrumpido: cancelando los trabajos en curso...")
+            runner.cancel()
+            finished.wait()
+
+    summary = holder["summary"] or {"estado": "cancelado", "fuentes": []}
+    output = json.dumps(summary, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + "\n")
+    print(output, file=stdout)
+
+    if summary["estado"] == "ok":
+        return EXIT_OK
+    if summary["estado"] == "cancelado":
+        return EXIT_INTERRUPTED
+    return EXIT_FAILED
+
+if __name__ == "__main__":
+    # Necesario para el pool de conversión en el ejecutable empaquetado
+    multiprocessing.freeze_support()
+    sys.exit(main())
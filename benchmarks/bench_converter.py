@@ -0,0 +1,280 @@
+"""
+Copyright (c) 2025 Alejandro Ramírez
+Bajo la Licencia de Autor Restringida (LAR) v1.0
+Más detalles en LICENSE
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+# Ejecución desde la raíz del repositorio o desde benchmarks/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.gherkinConverter import UltimateGherkinConverter
+
+# Redacciones que activan cada categoría de PATTERNS
+PATTERN_STEPS = {
+    'beneficiary': [
+        "Ingresar el primer nombre del Cliente",
+        "Capturar el apellido paterno",
+        "Ingresa apellido materno del beneficiario",
+        "Nombre del Cliente: **<Juan>**"
+    ],
+    'tarjeta': [
+        "Deslizar una tarjeta de débito",
+        "Desliza tarjeta en el lector",
+        "Operación con tarjeta de crédito"
+    ],
+    'cuenta': [
+        "Capturar los siguientes datos:\nNúmero de Cuenta **<0123456789>**",
+        "Capturar el: Número de Cuenta destino",
+        "Número de cuenta: **<9876543210>**"
+    ],
+    'desglose': [
+        "Capturar el total efectivo recibido",
+        "Registro de efectivo que ingresa a caja",
+        "Desglose monetario por denominación"
+    ],
+    'enter': [
+        "Dar \"Enter\"",
+        "Presionar tecla Enter"
+    ]
+}
+
+GENERIC_STEPS = [
+    "Ingresar a la aplicación con usuario cajero",
+    "Seleccionar la opción de pagos en el menú principal",
+    "Capturar la dirección del domicilio fiscal",
+    "Validar los datos mostrados en pantalla ✅",
+    "Hacer clic en el botón Continuar",
+    "⦿ Revisar el comprobante generado"
+]
+
+VALIDATIONS = [
+    "El sistema muestra la pantalla de captura",
+    "El sistema habilita el campo Importe",
+    "Se despliega el mensaje Operación exitosa",
+    "El sistema regresa a la pantalla inicial",
+    "---",
+    ""
+]
+
+MODULES = [
+    "Sucursales - Ventanilla - Pagos",
+    "Sucursales - Ventanilla - Depósitos",
+    "Banca Digital - Transferencias",
+    "Caja - Desglose de Efectivo",
+    "Tarjetas - Altas"
+]
+
+def synthetic_test_case(index: int, steps: int, rng: random.Random) -> Dict[str, Any]:
+    """Caso de prueba con la forma que produce ValueEdgeExtractor.get_test_case"""
+    categories = rng.sample(list(PATTERN_STEPS), k=rng.randint(0, len(PATTERN_STEPS)))
+    texts = [rng.choice(PATTERN_STEPS[category]) for category in categories]
+    texts += [rng.choice(GENERIC_STEPS) for _ in range(max(0, steps - len(texts)))]
+    rng.shuffle(texts)
+
+    return {
+        "Titulo": f"TC_{index}_Operación {rng.choice(['alta', 'baja', 'consulta', 'pago'])} {index}",
+        "Modulo": rng.choice(MODULES),
+        "CasoPrueba": {
+            str(position): {"paso": text, "validacion": rng.choice(VALIDATIONS)}
+            for position, text in enumerate(texts[:steps], 1)
+        }
+    }
+
+def synthetic_jira_issue(index: int, rng: random.Random) -> Dict[str, Any]:
+    """Issue con la forma que devuelve la búsqueda de JIRA (sin CasoPrueba)"""
+    return {
+        "id": str(10000 + index),
+        "key": f"BENCH-{index}",
+        "fields": {
+            "summary": f"Incidencia sintética {index}",
+            "description": " ".join(rng.choice(GENERIC_STEPS) for _ in range(5)),
+            "created": "2025-01-01T10:00:00.000-0600",
+            "updated": "2025-01-02T10:00:00.000-0600",
+            "status": {"name": rng.choice(["To Do", "In Progress", "Done"])},
+            "labels": rng.sample(["pagos", "ventanilla", "regresion", "smoke"], k=2)
+        }
+    }
+
+def write_corpus(directory: str, kind: str, size: int, steps: int, seed: int) -> List[str]:
+    """Generar 'size' JSON sintéticos en directory y devolver sus nombres"""
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    filenames = []
+
+    for index in range(size):
+        if kind == "jira":
+            record = synthetic_jira_issue(index, rng)
+            filename = f"{record['key']}.json"
+        else:
+            record = synthetic_test_case(index, steps, rng)
+            filename = f"{record['Titulo']}.json"
+        with open(os.path.join(directory, filename), 'w', encoding='utf-8') as f:
+            json.dump(record, f, indent=2, ensure_ascii=False)
+        filenames.append(filename)
+
+    return filenames
+
+def _timed(function: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return {
+        "min_s": round(min(samples), 6),
+        "median_s": round(statistics.median(samples), 6),
+        "max_s": round(max(samples), 6)
+    }
+
+def time_stages(converter: UltimateGherkinConverter, filenames: List[str], repeat: int) -> Dict[str, Any]:
+    """Medir por separado carga, _process_steps, _generate_feature y escritura"""
+    loaded, processed, rendered = [], [], []
+
+    def load():
+        loaded.clear()
+        for filename in filenames:
+            with open(os.path.join(converter.input_dir, filename), 'r', encoding='utf-8') as f:
+                loaded.append(json.load(f))
+
+    def process():
+        processed[:] = [converter._process_steps(data.get("CasoPrueba", {})) for data in loaded]
+
+    def generate():
+        rendered[:] = [
+            converter._generate_feature(
+                module=data.get("Modulo", "Modulo_Principal"),
+                title=data.get("Titulo", "Escenario_Principal"),
+                steps=steps
+            )
+            for data, steps in zip(loaded, processed)
+        ]
+
+    def write():
+        for filename, content in zip(filenames, rendered):
+            output_file = os.path.join(
+                converter.output_dir,
+                converter.filename_prefix + converter._normalize_filename(filename)
+            )
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(content)
+
+    os.makedirs(converter.output_dir, exist_ok=True)
+    return {
+        "load": _timed(load, repeat),
+        "process_steps": _timed(process, repeat),
+        "generate_feature": _timed(generate, repeat),
+        "write": _timed(write, repeat)
+    }
+
+def run_case(workdir: str, kind: str, size: int, steps: int, workers: int, repeat: int, seed: int) -> Dict[str, Any]:
+    """Generar un corpus y medir convert() completo y cada etapa"""
+    input_dir = os.path.join(workdir, f"{kind}_{size}_{steps}", "in")
+    output_dir = os.path.join(workdir, f"{kind}_{size}_{steps}", "out")
+    filenames = write_corpus(input_dir, kind, size, steps, seed)
+
+    # El conversor imprime una línea por archivo; se silencia para no medir la consola
+    with open(os.devnull, 'w') as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            converter = UltimateGherkinConverter(input_dir=input_dir, output_dir=output_dir)
+            serial = _timed(lambda: converter.convert(workers=1), repeat)
+            parallel = _timed(lambda: converter.convert(workers=workers), repeat) if workers > 1 else None
+            stages = time_stages(converter, filenames, repeat)
+        finally:
+            sys.stdout = stdout
+
+    result = {
+        "corpus": kind,
+        "files": size,
+        "steps_per_case": steps if kind == "ve" else None,
+        "convert_serial": serial,
+        "files_per_s_serial": round(size / serial["median_s"], 1) if serial["median_s"] else None,
+        "stages": stages
+    }
+    if parallel:
+        result["convert_parallel"] = {"workers": workers, **parallel}
+        result["files_per_s_parallel"] = round(size / parallel["median_s"], 1) if parallel["median_s"] else None
+    return result
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "desconocido"
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark del conversor Gherkin con corpus sintéticos"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000],
+                        help="Cantidad de JSON por corpus")
+    parser.add_argument("--steps", type=int, nargs="+", default=[5, 20],
+                        help="Pasos por caso de prueba de ValueEdge")
+    parser.add_argument("--corpus", choices=["ve", "jira", "all"], default="all",
+                        help="Tipo de corpus a generar")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Procesos para la medición en paralelo (1 la omite)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Repeticiones por medición; se reporta mínimo, mediana y máximo")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", help="Archivo JSON de resultados (por defecto stdout)")
+    parser.add_argument("--keep", action="store_true",
+                        help="Conservar los corpus generados en la carpeta temporal")
+    args = parser.parse_args()
+
+    kinds = ["ve", "jira"] if args.corpus == "all" else [args.corpus]
+    workdir = tempfile.mkdtemp(prefix="bench_converter_")
+    results = []
+
+    try:
+        for kind in kinds:
+            for size in args.sizes:
+                for steps in (args.steps if kind == "ve" else [0]):
+                    print(f"Midiendo corpus {kind} | {size} archivos | {steps} pasos", file=sys.stderr)
+                    results.append(run_case(workdir, kind, size, steps, args.workers, args.repeat, args.seed))
+    finally:
+        if args.keep:
+            print(f"Corpus conservados en {workdir}", file=sys.stderr)
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "benchmark": "converter",
+        "revision": _git_revision(),
+        "rules_version": UltimateGherkinConverter.RULES_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": results
+    }
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + "\n")
+        print(f"Resultados guardados en {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Copyright (c) 2025 Alejandro Ramírez
+Bajo la Licencia de Autor Restringida (LAR) v1.0
+Más detalles en LICENSE
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import platform
+import tempfile
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+# Ejecución desde la raíz del repositorio o desde benchmarks/
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+from core.httpTransport import HttpTransport
+from core.jiraExtractor import JiraExtractor
+from core.valueEdgeExtractor import ValueEdgeExtractor
+from bench_converter import _git_revision
+from mock_servers import MockService
+
+class RequestRecorder:
+    """Registrar latencia y código de cada respuesta con los hooks de requests"""
+
+    def __init__(self, transport: HttpTransport):
+        self.latencies: List[float] = []
+        self.statuses = Counter()
+        self._lock = threading.Lock()
+        transport.session.hooks["response"].append(self._record)
+
+    def _record(self, response, *args, **kwargs):
+        with self._lock:
+            self.latencies.append(response.elapsed.total_seconds())
+            self.statuses[str(response.status_code)] += 1
+        return response
+
+    def summary(self, wall: float) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+        return {
+            "requests": len(latencies),
+            "requests_per_s": round(len(latencies) / wall, 1) if wall else None,
+            "latency_p50_ms": round(_percentile(latencies, 50) * 1000, 2),
+            "latency_p99_ms": round(_percentile(latencies, 99) * 1000, 2),
+            "latency_max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+            "statuses": dict(self.statuses)
+        }
+
+def _percentile(values: List[float], percent: float) -> float:
+    """Percentil por rango más cercano sobre una lista ordenada"""
+    if not values:
+        return 0.0
+    rank = max(1, round(percent / 100 * len(values)))
+    return values[min(rank, len(values)) - 1]
+
+def bench_jira(base_url: str, project: str, rps: float, page_workers: int, workdir: str) -> Dict[str, Any]:
+    """Exportar un proyecto completo del servidor simulado"""
+    transport = HttpTransport(requests_per_second=rps)
+    recorder = RequestRecorder(transport)
+    extractor = JiraExtractor(base_url, "bench@example.com", "token", transport=transport)
+
+    start = time.perf_counter()
+    if not extractor.check_connection():
+        raise RuntimeError("El servidor simulado de JIRA rechazó la conexión")
+    extracted = extractor.export_project(project, os.path.join(workdir, "jira"), max_workers=page_workers)
+    wall = time.perf_counter() - start
+
+    return {"scenario": "jira_export_project", "items": extracted, "wall_s": round(wall, 3),
+            **recorder.summary(wall)}
+
+def bench_valueedge(base_url: str, rps: float, workers: int, workdir: str) -> Dict[str, Any]:
+    """Extraer el workspace completo del servidor simulado"""
+    config_path = os.path.join(workdir, "mock_secrets.ini")
+    with open(config_path, "w", encoding="utf-8") as f:
+        f.write(
+            "[ValueEdge]\n"
+            f"URL = {base_url}\n"
+            "SHARED_SPACE = 1001\n"
+            "WORKSPACE = 1002\n"
+            "TECH_PREVIEW_FLAG = true\n"
+            "USER = bench\n"
+            "PASSWORD = bench\n"
+            f"LOGIN = {base_url}/authentication/sign_in\n"
+        )
+
+    transport = HttpTransport(requests_per_second=rps, verify=False)
+    recorder = RequestRecorder(transport)
+    extractor = ValueEdgeExtractor(config_path, transport=transport)
+
+    start = time.perf_counter()
+    if not extractor.login():
+        raise RuntimeError("El servidor simulado de ValueEdge rechazó el login")
+    summary = extractor.extract_all_test_cases(os.path.join(workdir, "ve"), max_workers=workers)
+    wall = time.perf_counter() - start
+
+    return {"scenario": "ve_extract_all_test_cases", "items": summary["exitosos"],
+            "failed": summary["fallidos"], "wall_s": round(wall, 3), **recorder.summary(wall)}
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark de los extractores contra servidores simulados de JIRA y ValueEdge"
+    )
+    parser.add_argument("--target", choices=["jira", "ve", "all"], default="all")
+    parser.add_argument("--issues", type=int, default=500, help="Issues del proyecto simulado")
+    parser.add_argument("--tests", type=int, default=500, help="Tests del workspace simulado")
+    parser.add_argument("--steps", type=int, default=6, help="Pasos por script de ValueEdge")
+    parser.add_argument("--latency", type=float, default=0.02, help="Latencia del servidor (s)")
+    parser.add_argument("--jitter", type=float, default=0.01, help="Latencia aleatoria adicional (s)")
+    parser.add_argument("--jira-page-size", type=int, default=100)
+    parser.add_argument("--ve-page-size", type=int, default=1000)
+    parser.add_argument("--throttle-every", type=int, default=0,
+                        help="Responder 429 cada N solicitudes (0 lo desactiva)")
+    parser.add_argument("--retry-after", type=float, default=0.2, help="Retry-After de los 429 (s)")
+    parser.add_argument("--session-ttl", type=float, default=0.0,
+                        help="Vida de la sesión de ValueEdge en segundos (0 = sin expirar)")
+    parser.add_argument("--rps", type=float, default=10.0,
+                        help="Límite inicial de solicitudes/s del transporte (0 = sin límite)")
+    parser.add_argument("--workers", type=int, default=8, help="Hilos de descarga de ValueEdge")
+    parser.add_argument("--jira-page-workers", type=int, default=4,
+                        help="Páginas de búsqueda de JIRA pedidas a la vez (1 = secuencial)")
+    parser.add_argument("--output", help="Archivo JSON de resultados (por defecto stdout)")
+    parser.add_argument("--verbose", action="store_true", help="Mostrar el log de los extractores")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.ERROR,
+        format='[%(asctime)s] %(levelname)s @ %(module)s: %(message)s',
+        force=True
+    )
+
+    service = MockService(
+        issues=args.issues,
+        tests=args.tests,
+        steps=args.steps,
+        latency=args.latency,
+        jitter=args.jitter,
+        jira_page_size=args.jira_page_size,
+        ve_page_size=args.ve_page_size,
+        throttle_every=args.throttle_every,
+        retry_after=args.retry_after,
+        session_ttl=args.session_ttl
+    )
+    base_url = service.start()
+    workdir = tempfile.mkdtemp(prefix="bench_extractors_")
+    results = []
+
+    try:
+        if args.target in ("jira", "all"):
+            print(f"Midiendo JIRA | {args.issues} issues", file=sys.stderr)
+            results.append(bench_jira(base_url, "BENCH", args.rps, args.jira_page_workers, workdir))
+        if args.target in ("ve", "all"):
+            print(f"Midiendo ValueEdge | {args.tests} tests | {args.workers} hilos", file=sys.stderr)
+            results.append(bench_valueedge(base_url, args.rps, args.workers, workdir))
+    finally:
+        service.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "benchmark": "extractors",
+        "revision": _git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "server": {
+            key: value for key, value in vars(args).items()
+            if key not in ("output", "verbose", "target", "rps", "workers", "jira_page_workers")
+        },
+        "client": {"rps": args.rps, "workers": args.workers, "jira_page_workers": args.jira_page_workers},
+        "server_requests": dict(service.stats),
+        "results": results
+    }
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+        print(f"Resultados guardados en {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Copyright (c) 2025 Alejandro Ramírez
+Bajo la Licencia de Autor Restringida (LAR) v1.0
+Más detalles en LICENSE
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+# Ejecución desde la raíz del repositorio o desde benchmarks/
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+from bench_converter import _git_revision
+
+# Módulos cuyo tiempo de importación se mide, cada uno en un intérprete nuevo
+MODULES = [
+    "main",
+    "core.jiraExtractor",
+    "core.valueEdgeExtractor",
+    "core.gherkinConverter",
+    "core.httpTransport",
+    "core.pipeline",
+    "core.metrics"
+]
+# Dependencias que la ventana principal no debería cargar al iniciar
+HEAVY_MODULES = [
+    "requests",
+    "core.jiraExtractor",
+    "core.valueEdgeExtractor",
+    "core.gherkinConverter",
+    "core.httpTransport",
+    "core.httpCache",
+    "cProfile"
+]
+GUI_MODULES = ["tkinter", "_tkinter"]
+
+_IMPORT_PROBE = """
+import sys, time, json
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+watched = {watched!r}
+print(json.dumps({{"s": elapsed, "loaded": [name for name in watched if name in sys.modules]}}))
+"""
+
+def _stats(samples: List[float]) -> Dict[str, float]:
+    return {
+        "min_s": round(min(samples), 6),
+        "median_s": round(statistics.median(samples), 6),
+        "max_s": round(max(samples), 6)
+    }
+
+def _last_line(text: str) -> str:
+    lines = text.strip().splitlines()
+    return lines[-1] if lines else "sin salida"
+
+def measure_import(python: str, module: str, repeat: int) -> Dict[str, Any]:
+    """Tiempo de 'import module' en intérpretes nuevos y qué dependencias arrastra"""
+    code = _IMPORT_PROBE.format(root=REPO_DIR, module=module, watched=HEAVY_MODULES + GUI_MODULES)
+    samples, loaded = [], []
+
+    for _ in range(repeat):
+        result = subprocess.run([python, "-c", code], capture_output=True, text=True, cwd=REPO_DIR)
+        if result.returncode:
+            return {"module": module, "error": _last_line(result.stderr)}
+        data = json.loads(_last_line(result.stdout))
+        samples.append(data["s"])
+        loaded = data["loaded"]
+
+    return {
+        "module": module,
+        **_stats(samples),
+        "gui_imported": any(name in loaded for name in GUI_MODULES),
+        "heavy_loaded": [name for name in loaded if name in HEAVY_MODULES and name != module]
+    }
+
+def top_imports(python: str, module: str, top: int) -> List[Dict[str, Any]]:
+    """Importaciones con mayor tiempo acumulado según python -X importtime"""
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=REPO_DIR
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = [part.strip() for part in line[len("import time:"):].split("|")]
+        if len(parts) != 3 or not parts[0].isdigit():
+            continue
+        entries.append({"module": parts[2], "self_ms": int(parts[0]) / 1000, "cumulative_ms": int(parts[1]) / 1000})
+    return sorted(entries, key=lambda entry: entry["cumulative_ms"], reverse=True)[:top]
+
+def measure_first_window(command: List[str], repeat: int, timeout: float) -> Dict[str, Any]:
+    """
+    Tiempo desde lanzar el proceso hasta que la ventana principal es visible
+
+    La aplicación (main.py o el ejecutable DICAI) escribe el instante en el
+    archivo de DICAI_STARTUP_PROBE al mostrar la ventana y se cierra.
+    """
+    samples = []
+
+    for _ in range(repeat):
+        path = os.path.join(tempfile.mkdtemp(prefix="bench_startup_"), "probe.json")
+        env = {**os.environ, "DICAI_STARTUP_PROBE": path}
+        start = time.time()
+        try:
+            result = subprocess.run(command, env=env, cwd=REPO_DIR, capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return {"command": command, "error": f"La ventana no apareció en {timeout:.0f}s"}
+        if not os.path.exists(path):
+            return {"command": command, "error": _last_line(result.stderr)}
+
+        with open(path, "r", encoding="utf-8") as f:
+            samples.append(json.load(f)["ready"] - start)
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+    return {"command": command, **_stats(samples)}
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark de inicio: tiempo de importación y hasta la primera ventana"
+    )
+    parser.add_argument("--python", default=sys.executable, help="Intérprete para medir las importaciones")
+    parser.add_argument("--command", nargs="+",
+                        help="Comando de la aplicación (por defecto: python main.py; "
+                             "puede ser la ruta de DICAI.exe)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Repeticiones por medición; se reporta mínimo, mediana y máximo")
+    parser.add_argument("--top", type=int, default=15, help="Importaciones más lentas de main a reportar")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Espera máxima por la ventana (s)")
+    parser.add_argument("--skip-window", action="store_true",
+                        help="Medir solo importaciones (sin pantalla disponible)")
+    parser.add_argument("--output", help="Archivo JSON de resultados (por defecto stdout)")
+    args = parser.parse_args()
+
+    imports = []
+    for module in MODULES:
+        print(f"Midiendo import {module}", file=sys.stderr)
+        imports.append(measure_import(args.python, module, args.repeat))
+
+    first_window = None
+    if not args.skip_window:
+        command = args.command or [args.python, os.path.join(REPO_DIR, "main.py")]
+        print(f"Midiendo primera ventana | {' '.join(command)}", file=sys.stderr)
+        first_window = measure_first_window(command, args.repeat, args.timeout)
+
+    report = {
+        "benchmark": "startup",
+        "revision": _git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "imports": imports,
+        "main_top_imports": top_imports(args.python, "main", args.top),
+        "first_window": first_window
+    }
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+        print(f"Resultados guardados en {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
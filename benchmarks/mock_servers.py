@@ -0,0 +1,308 @@
+"""
+Copyright (c) 2025 Alejandro Ramírez
+Bajo la Licencia de Autor Restringida (LAR) v1.0
+Más detalles en LICENSE
+"""
+
+import re
+import json
+import time
+import random
+import argparse
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from bench_converter import GENERIC_STEPS, MODULES, PATTERN_STEPS, VALIDATIONS
+
+_JIRA_ISSUE_RE = re.compile(r"^/rest/api/3/issue/([^/]+)$")
+_VE_TESTS_RE = re.compile(r"^/api/shared_spaces/[^/]+/workspaces/[^/]+/tests$")
+_VE_SCRIPT_RE = re.compile(r"^/api/shared_spaces/[^/]+/workspaces/[^/]+/tests/([^/]+)/script$")
+_QUERY_IDS_RE = re.compile(r"'([^']+)'")
+_PROJECT_RE = re.compile(r"project\s*=\s*\"?([A-Za-z0-9_]+)")
+
+class MockService:
+    """
+    Simulación local de las APIs de JIRA y ValueEdge que usan los extractores
+
+    Sirve /rest/api/3/myself, /search e /issue/{id} de JIRA y
+    /authentication/sign_in, /tests y /tests/{id}/script de ValueEdge con
+    datos sintéticos deterministas. Permite fijar latencia (más jitter),
+    tamaño máximo de página, un 429 con Retry-After cada N solicitudes y
+    la duración de las sesiones de ValueEdge (401 al expirar).
+    """
+
+    def __init__(
+        self,
+        issues: int = 500,
+        tests: int = 500,
+        steps: int = 6,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        jira_page_size: int = 100,
+        ve_page_size: int = 1000,
+        throttle_every: int = 0,
+        retry_after: float = 0.2,
+        session_ttl: float = 0.0,
+        seed: int = 1234
+    ):
+        """
+        Args:
+            issues: Issues por proyecto de JIRA
+            tests: Tests del workspace de ValueEdge
+            steps: Pasos por script de ValueEdge
+            latency: Latencia base por respuesta (segundos)
+            jitter: Latencia adicional aleatoria máxima (segundos)
+            jira_page_size: Máximo de issues por página de /search
+            ve_page_size: Máximo de tests por página de /tests
+            throttle_every: Responder 429 cada N solicitudes (0 lo desactiva)
+            retry_after: Valor de Retry-After en los 429 (segundos)
+            session_ttl: Vida de una sesión de ValueEdge en segundos (0 = sin expirar)
+            seed: Semilla de los datos sintéticos
+        """
+        self.issues = issues
+        self.tests = tests
+        self.steps = steps
+        self.latency = latency
+        self.jitter = jitter
+        self.jira_page_size = jira_page_size
+        self.ve_page_size = ve_page_size
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.session_ttl = session_ttl
+        self.seed = seed
+
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self._request_count = 0
+        self._sessions: Dict[str, float] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # --- Ciclo de vida -------------------------------------------------
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Arrancar el servidor en segundo plano y devolver su URL base"""
+        self._server = ThreadingHTTPServer((host, port), _MockHandler)
+        self._server.daemon_threads = True
+        self._server.service = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-server", daemon=True)
+        self._thread.start()
+        return f"http://{host}:{self._server.server_address[1]}"
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    # --- Datos sintéticos ----------------------------------------------
+
+    def issue(self, project: str, index: int) -> Dict[str, Any]:
+        created = datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=index)
+        return {
+            "id": str(10000 + index),
+            "key": f"{project}-{index + 1}",
+            "fields": {
+                "summary": f"Incidencia sintética {index + 1}",
+                "created": created.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+                "updated": created.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+                "status": {"name": "To Do"}
+            }
+        }
+
+    def test_id(self, index: int) -> str:
+        return str(1000 + index)
+
+    def test_info(self, test_id: str) -> Dict[str, Any]:
+        index = int(test_id) - 1000
+        rng = random.Random(self.seed + index)
+        return {
+            "id": test_id,
+            "name": f"TC_{index}_Caso sintético {index}",
+            "application_modules": {"data": [{"name": rng.choice(MODULES)}]}
+        }
+
+    def script(self, test_id: str) -> str:
+        rng = random.Random(self.seed + int(test_id))
+        lines = []
+        for _ in range(self.steps):
+            category = rng.choice(list(PATTERN_STEPS) + [None, None])
+            lines.append(rng.choice(PATTERN_STEPS[category] if category else GENERIC_STEPS))
+            lines.append(f"? {rng.choice(VALIDATIONS) or 'El sistema continúa'}")
+        return "- " + "\n- ".join(lines)
+
+    # --- Atención de solicitudes ---------------------------------------
+
+    def handle(self, method: str, path: str, query: Dict[str, str], headers, body: bytes) -> Tuple[int, Any, Dict[str, str]]:
+        """Resolver una solicitud y devolver (código, cuerpo JSON, cabeceras)"""
+        with self._lock:
+            self._request_count += 1
+            throttled = self.throttle_every and self._request_count % self.throttle_every == 0
+
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+
+        endpoint, status, payload, extra = self._route(method, path, query, headers, body, throttled)
+        with self._lock:
+            self.stats[f"{endpoint} {status}"] += 1
+        return status, payload, extra
+
+    def _route(self, method, path, query, headers, body, throttled):
+        if path.startswith("/rest/api/3/"):
+            endpoint = "jira:" + (path.rsplit("/", 1)[-1] if "/issue/" not in path else "issue")
+            if throttled:
+                return endpoint, 429, {"errorMessages": ["Rate limit exceeded"]}, {"Retry-After": str(self.retry_after)}
+            if not headers.get("Authorization", "").startswith("Basic "):
+                return endpoint, 401, {"errorMessages": ["No autenticado"]}, {}
+            return (endpoint, *self._jira(path, query))
+
+        if path == "/authentication/sign_in" and method == "POST":
+            return ("ve:sign_in", *self._sign_in(body))
+
+        if path.startswith("/api/"):
+            endpoint = "ve:script" if path.endswith("/script") else "ve:tests"
+            if throttled:
+                return endpoint, 429, {"message": "Too many requests"}, {"Retry-After": str(self.retry_after)}
+            if not self._session_valid(headers.get("Cookie", "")):
+                return endpoint, 401, {"message": "Sesión expirada"}, {}
+            return (endpoint, *self._valueedge(path, query))
+
+        return "desconocido", 404, {"message": f"Ruta no simulada: {path}"}, {}
+
+    def _jira(self, path, query):
+        if path == "/rest/api/3/myself":
+            return 200, {
+                "accountId": "mock",
+                "displayName": "Usuario Mock",
+                "emailAddress": "mock@example.com",
+                "timeZone": "America/Mexico_City"
+            }, {}
+
+        if path == "/rest/api/3/search":
+            match = _PROJECT_RE.search(query.get("jql", ""))
+            project = match.group(1) if match else "MOCK"
+            start_at = int(query.get("startAt", 0))
+            limit = min(int(query.get("maxResults", 50)), self.jira_page_size)
+            issues = [self.issue(project, i) for i in range(start_at, min(start_at + limit, self.issues))]
+            return 200, {"startAt": start_at, "maxResults": limit, "total": self.issues, "issues": issues}, {}
+
+        match = _JIRA_ISSUE_RE.match(path)
+        if match:
+            project, _, number = match.group(1).rpartition("-")
+            if project and number.isdigit() and 0 < int(number) <= self.issues:
+                return 200, self.issue(project, int(number) - 1), {}
+            return 404, {"errorMessages": ["Issue does not exist"]}, {}
+
+        return 404, {"errorMessages": [f"Ruta no simulada: {path}"]}, {}
+
+    def _sign_in(self, body):
+        try:
+            credentials = json.loads(body or b"{}")
+        except ValueError:
+            credentials = {}
+        if not credentials.get("client_id"):
+            return 401, {"message": "Credenciales inválidas"}, {}
+
+        token = f"mock-{random.getrandbits(64):x}"
+        with self._lock:
+            self._sessions[token] = time.monotonic() + self.session_ttl if self.session_ttl else float("inf")
+        cookies = [f"OCTANE_USER={credentials['client_id']}; Path=/", f"LWSSO_COOKIE_KEY={token}; Path=/"]
+        return 200, {}, {"Set-Cookie": cookies}
+
+    def _session_valid(self, cookie_header: str) -> bool:
+        cookies = dict(
+            part.strip().split("=", 1) for part in cookie_header.split(";") if "=" in part
+        )
+        with self._lock:
+            expires = self._sessions.get(cookies.get("LWSSO_COOKIE_KEY"))
+        return expires is not None and time.monotonic() < expires
+
+    def _valueedge(self, path, query):
+        match = _VE_SCRIPT_RE.match(path)
+        if match:
+            test_id = match.group(1)
+            if not test_id.isdigit() or not 0 <= int(test_id) - 1000 < self.tests:
+                return 404, {"message": "Test no encontrado"}, {}
+            return 200, {"script": self.script(test_id)}, {}
+
+        if _VE_TESTS_RE.match(path):
+            if "query" in query:
+                ids = [
+                    test_id for test_id in _QUERY_IDS_RE.findall(query["query"])
+                    if test_id.isdigit() and 0 <= int(test_id) - 1000 < self.tests
+                ]
+                return 200, {"total_count": len(ids), "data": [self.test_info(test_id) for test_id in ids]}, {}
+
+            offset = int(query.get("offset", 0))
+            limit = min(int(query.get("limit", 100)), self.ve_page_size)
+            data = [{"id": self.test_id(i)} for i in range(offset, min(offset + limit, self.tests))]
+            return 200, {"total_count": self.tests, "data": data}, {}
+
+        return 404, {"message": f"Ruta no simulada: {path}"}, {}
+
+class _MockHandler(BaseHTTPRequestHandler):
+    # Keep-alive para que el pool de conexiones del transporte se reutilice
+    protocol_version = "HTTP/1.1"
+
+    def _dispatch(self, method: str) -> None:
+        parts = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        status, payload, extra = self.server.service.handle(method, parts.path, query, self.headers, body)
+        content = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in extra.items():
+            for item in (value if isinstance(value, list) else [value]):
+                self.send_header(name, item)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def log_message(self, format, *args):
+        # Sin registro por solicitud: distorsionaría las mediciones
+        pass
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidores simulados de JIRA y ValueEdge")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--issues", type=int, default=500)
+    parser.add_argument("--tests", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--throttle-every", type=int, default=0)
+    parser.add_argument("--session-ttl", type=float, default=0.0)
+    args = parser.parse_args()
+
+    service = MockService(
+        issues=args.issues,
+        tests=args.tests,
+        latency=args.latency,
+        jitter=args.jitter,
+        throttle_every=args.throttle_every,
+        session_ttl=args.session_ttl
+    )
+    url = service.start(port=args.port)
+    print(f"Servidor simulado en {url} (Ctrl+C para detener)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        service.stop()
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,14 @@ a = Analysis(
         'jiraExtractor',
         'valueEdgeExtractor',
         'gherkinConverter',
+        'httpTransport',
+        'httpCache',
+        'checkpoint',
+        'textNormalizer',
+        'metrics',
+        'pipeline',
+        'runControl',
+        'config',
         'time'  # Añadir si se usa throttling
     ]
 
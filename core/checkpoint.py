@@ -0,0 +1,152 @@
+"""
+Copyright (c) 2025 Alejandro Ramírez
+Bajo la Licencia de Autor Restringida (LAR) v1.0
+Más detalles en LICENSE
+"""
+
+import os
+import json
+import logging
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Carpeta por defecto de los journals de extracción
+CHECKPOINT_DIR = os.path.join("output", "checkpoints")
+
+class CheckpointJournal:
+    """
+    Journal append-only para reanudar extracciones interrumpidas
+
+    Cada línea es un registro JSON: {"done": id} por elemento terminado y
+    {"cursor": valor} cuando avanza la posición de paginación. Al abrir un
+    journal existente se reconstruyen los IDs completados y el último cursor;
+    una última línea truncada por un cierre abrupto se ignora. Los registros
+    que llegan después de close() (ej: guardados en segundo plano que terminan
+    tras una cancelación) se descartan: esos elementos se repiten al reanudar.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.completed = set()
+        self.cursor: Optional[Any] = None
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            self._replay()
+            logger.info(
+                "Reanudando desde %s | %d completados | Cursor: %s",
+                self.path, len(self.completed), self.cursor
+            )
+
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    @classmethod
+    def for_run(cls, source: str, name: str, base_dir: str = CHECKPOINT_DIR) -> "CheckpointJournal":
+        """Journal de una ejecución concreta (ej: source='jira', name='BT115')"""
+        return cls(os.path.join(base_dir, f"{source}_{name}.journal"))
+
+    @property
+    def resumed(self) -> bool:
+        return bool(self.completed) or self.cursor is not None
+
+    def _replay(self) -> None:
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if "done" in record:
+                    self.completed.add(str(record["done"]))
+                if "cursor" in record:
+                    self.cursor = record["cursor"]
+
+    def _append(self, record: dict) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._file.flush()
+
+    def is_done(self, item_id: Any) -> bool:
+        return str(item_id) in self.completed
+
+    def mark_done(self, item_id: Any) -> None:
+        """Registrar un elemento como terminado"""
+        self.completed.add(str(item_id))
+        self._append({"done": str(item_id)})
+
+    def set_cursor(self, cursor: Any) -> None:
+        """Registrar la posición de paginación a partir de la cual reanudar"""
+        if cursor == self.cursor:
+            return
+        self.cursor = cursor
+        self._append({"cursor": cursor})
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def complete(self) -> None:
+        """Cerrar y eliminar el journal de una ejecución terminada"""
+        self.close()
+        try:
+            self.path.unlink()
+        except OSError as e:
+            logger.warning("No se pudo eliminar el journal %s: %s", self.path, str(e))
+
+class PageTracker:
+    """
+    Cursor de paginación que solo avanza sobre elementos ya guardados
+
+    Cada página se abre con los IDs que aún faltan y mark_done() los registra
+    en el journal cuando su guardado termina, desde cualquier hilo (ej: la
+    confirmación de un FeaturePipeline). El cursor apunta siempre al inicio
+    de la primera página con elementos sin guardar, así que al reanudar no se
+    salta nada que no esté en disco.
+    """
+
+    def __init__(self, journal: CheckpointJournal):
+        self.journal = journal
+        # Páginas abiertas: [offset inicial, offset final, pendientes]
+        self._pages = deque()
+        self._page_of = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cursor(self) -> Optional[Any]:
+        return self.journal.cursor
+
+    def is_done(self, item_id: Any) -> bool:
+        return self.journal.is_done(item_id)
+
+    def open_page(self, start: int, end: int, pending: Iterable[Any]) -> None:
+        """Registrar una página [start, end) con los IDs que faltan por guardar"""
+        with self._lock:
+            entry = [start, end, 0]
+            for item_id in pending:
+                if str(item_id) not in self._page_of:
+                    self._page_of[str(item_id)] = entry
+                    entry[2] += 1
+            self._pages.append(entry)
+            self._advance()
+
+    def mark_done(self, item_id: Any) -> None:
+        """Registrar un elemento guardado y avanzar el cursor si su página quedó completa"""
+        with self._lock:
+            self.journal.mark_done(item_id)
+            entry = self._page_of.pop(str(item_id), None)
+            if entry:
+                entry[2] -= 1
+                self._advance()
+
+    def _advance(self) -> None:
+        while self._pages and self._pages[0][2] == 0:
+            closed = self._pages.popleft()
+            self.journal.set_cursor(self._pages[0][0] if self._pages else closed[1])
@@ -0,0 +1,69 @@
+"""
+Copyright (c) 2025 Alejandro Ramírez
+Bajo la Licencia de Autor Restringida (LAR) v1.0
+Más detalles en LICENSE
+"""
+
+import os
+import sys
+import logging
+import threading
+import configparser
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Claves obligatorias de secrets.ini por sección
+REQUIRED_KEYS = {
+    'ValueEdge': ['URL', 'USER', 'PASSWORD', 'SHARED_SPACE'],
+    'JIRA': ['URL', 'EMAIL', 'API_TOKEN']
+}
+
+class ConfigError(ValueError):
+    """Archivo de configuración ausente o ilegible"""
+
+def default_config_path() -> str:
+    """secrets/secrets.ini junto al programa, también dentro del ejecutable empaquetado"""
+    if getattr(sys, 'frozen', False):
+        base_dir = sys._MEIPASS
+    else:
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, 'secrets', 'secrets.ini')
+
+_configs: Dict[str, configparser.ConfigParser] = {}
+_configs_lock = threading.Lock()
+
+def load_config(config_path: Optional[str] = None) -> configparser.ConfigParser:
+    """
+    Leer secrets.ini una sola vez por proceso
+
+    Todas las llamadas con la misma ruta reciben el mismo objeto, que debe
+    tratarse como de solo lectura: la aplicación, los extractores y batch.py
+    lo comparten.
+
+    Args:
+        config_path: Ruta del archivo; por defecto default_config_path()
+    """
+    path = os.path.abspath(config_path or default_config_path())
+    with _configs_lock:
+        config = _configs.get(path)
+        if config is None:
+            config = configparser.ConfigParser()
+            if not config.read(path, encoding='utf-8'):
+                raise ConfigError(f"No se pudo leer el archivo de configuración: {path}")
+            logger.debug("Configuración cargada desde %s", path)
+            _configs[path] = config
+        return config
+
+def missing_keys(config: configparser.ConfigParser, required: Dict[str, List[str]] = REQUIRED_KEYS) -> List[str]:
+    """Secciones y claves obligatorias que faltan en la configuración"""
+    errors = []
+    for section, keys in required.items():
+        if not config.has_section(section):
+            errors.append(f"Falta sección: [{section}]")
+            continue
+
+        for key in keys:
+            if not config.has_option(section, key):
+                errors.append(f"Falta clave: [{section}] {key}")
+    return errors
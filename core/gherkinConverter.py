@@ -4,18 +4,99 @@ Bajo la Licencia de Autor Restringida (LAR) v1.0
 Más detalles en LICENSE
 """ 
 
+import hashlib
 import json
+import multiprocessing
 import os
 import re
 import textwrap
-import time
-import unicodedata
-from typing import Dict, Any
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, Any, List, Optional
+
+try:
+    from core.metrics import METRICS
+    from core.textNormalizer import StepTextCache, clean_step_text, normalize_filename
+except ImportError:  # Ejecución directa desde core/
+    from metrics import METRICS
+    from textNormalizer import StepTextCache, clean_step_text, normalize_filename
+
+PATTERNS = {
+    'beneficiary': [
+        r"(?:Ingresa|Ingresar|Capturar) (?:el )?(?:primer )?nombre del Cliente\b.*",
+        r"(?:Ingresa|Ingresar|Capturar) (?:el )?apellido paterno\b.*",
+        r"(?:Ingresa|Ingresar|Capturar) (?:el )?apellido materno\b.*",
+        r"Capturar el primer nombre del Cliente\b.*",
+        r"Nombre del Cliente:?\s*\*\*<.*>\*\*"
+    ],
+    'tarjeta': [
+        r"[Dd]eslizar? (?:una )?tarjeta\b",
+        r"[Dd]esliza (?:una )?tarjeta\b",
+        r"Operación con tarjeta.*"
+    ],
+    'cuenta': [
+        r"Capturar los siguientes datos:\s*\n?N[úu]mero de Cuenta \*\*<.*>\*\*",
+        r"Capturar los siguientes datos:\s*\n?N[úu]mero de Tarjeta \*\*<.*>\*\*",
+        r"Capturar (?:los siguientes datos|el):.*N[úu]mero de Cuenta.*",
+        r"N[úu]mero de cuenta:?\s*\*\*<.*>\*\*"
+    ],
+    'desglose': [
+        r"Capturar (?:el|registro|desglose) (?:total )?efectivo.*",
+        r"Registro de efectivo (?:que ingresa|sale).*",
+        r"Desglose monetario.*"
+    ],
+    'enter': [
+        r"Dar \"Enter\"",
+        r"Presionar tecla Enter",
+        r"Confirmar con Enter"
+    ]
+}
+
+# Manifiesto de la conversión incremental dentro de output_dir
+MANIFEST_FILE = ".conversion_manifest.json"
+# Serializa las actualizaciones del manifiesto desde varios pipelines del proceso
+_MANIFEST_LOCK = threading.Lock()
+
+# Categorías que influyen en los pasos generados
+DETECTED_CATEGORIES = ('beneficiary', 'tarjeta', 'cuenta', 'desglose')
+# Letras con las que empieza algún patrón de DETECTED_CATEGORIES (sin distinguir
+# mayúsculas); actualizar al añadir patrones con otra inicial
+PATTERN_INITIALS = 'cdinor'
+
+def _compile_pattern_engine() -> re.Pattern:
+    """
+    Combinar todas las categorías en una sola alternancia con grupos con nombre
+
+    Cada categoría va dentro de un lookahead para que las coincidencias no
+    consuman texto: finditer prueba cada posición una sola vez y lastgroup
+    indica qué categoría coincidió allí. El '.*' final de un patrón no cambia
+    si un paso coincide, así que se omite, y la clase de iniciales descarta
+    en una sola comprobación las posiciones donde no puede empezar ninguno.
+    """
+    alternatives = []
+    for category in DETECTED_CATEGORIES:
+        patterns = '|'.join(re.sub(r'\.\*$', '', pattern) for pattern in PATTERNS[category])
+        alternatives.append(f"(?=(?P<{category}>{patterns}))")
+    return re.compile(f"(?=[{PATTERN_INITIALS}])(?:{'|'.join(alternatives)})", re.IGNORECASE)
+
+# Expresiones compiladas al importar el módulo
+_NON_WORD_STEP_RE = re.compile(r'^[\d\W]+$')
+_MODULE_SEPARATORS_RE = re.compile(r'\W+')
+_TITLE_SEPARATORS_RE = re.compile(r'[\W_]+')
 
 class UltimateGherkinConverter:
-    def __init__(self, input_dir: str, output_dir: str):
+    # Versión de las reglas de conversión; incrementarla al cambiar patrones,
+    # pasos generados o formato de salida invalida la conversión incremental
+    RULES_VERSION = "1.05.1"
+
+    # Motor de patrones compilado una vez por clase
+    _PATTERN_ENGINE = _compile_pattern_engine()
+
+    def __init__(self, input_dir: str = "", output_dir: str = "", filename_prefix: str = ""):
         self.input_dir = input_dir
         self.output_dir = output_dir
+        self.filename_prefix = filename_prefix
         
         # print("""
         #     ███████╗ ████████╗████████╗ ██████╗ ████████╗
@@ -28,48 +109,16 @@ class UltimateGherkinConverter:
         #       """)    
         
         print("\nInicializando modelo de procesamiento de IA...\n")
-        time.sleep(2)
 
 
     def _clean_text(self, text: str) -> str:
-        return re.sub(r'[^\wá-úÁ-Ú \n\-]', '', text, flags=re.IGNORECASE).strip()
+        return clean_step_text(text)
 
     def _is_valid_step(self, text: str) -> bool:
         clean_text = text.strip() if text else ''
-        return len(clean_text) > 2 and not re.match(r'^[\d\W]+$', clean_text)
-
-    def _detect_patterns(self, steps: list) -> Dict[str, Any]:
-        patterns = {
-            'beneficiary': [
-                r"(?:Ingresa|Ingresar|Capturar) (?:el )?(?:primer )?nombre del Cliente\b.*",
-                r"(?:Ingresa|Ingresar|Capturar) (?:el )?apellido paterno\b.*",
-                r"(?:Ingresa|Ingresar|Capturar) (?:el )?apellido materno\b.*",
-                r"Capturar el primer nombre del Cliente\b.*",
-                r"Nombre del Cliente:?\s*\*\*<.*>\*\*"
-            ],
-            'tarjeta': [
-                r"[Dd]eslizar? (?:una )?tarjeta\b",
-                r"[Dd]esliza (?:una )?tarjeta\b",
-                r"Operación con tarjeta.*"
-            ],
-            'cuenta': [
-                r"Capturar los siguientes datos:\s*\n?N[úu]mero de Cuenta \*\*<.*>\*\*",
-                r"Capturar los siguientes datos:\s*\n?N[úu]mero de Tarjeta \*\*<.*>\*\*",
-                r"Capturar (?:los siguientes datos|el):.*N[úu]mero de Cuenta.*",
-                r"N[úu]mero de cuenta:?\s*\*\*<.*>\*\*"
-            ],
-            'desglose': [
-                r"Capturar (?:el|registro|desglose) (?:total )?efectivo.*",
-                r"Registro de efectivo (?:que ingresa|sale).*",
-                r"Desglose monetario.*"
-            ],
-            'enter': [
-                r"Dar \"Enter\"",
-                r"Presionar tecla Enter",
-                r"Confirmar con Enter"
-            ]
-        }
-        
+        return len(clean_text) > 2 and not _NON_WORD_STEP_RE.match(clean_text)
+
+    def _detect_patterns(self, steps: list, clean: Optional[StepTextCache] = None) -> Dict[str, Any]:
         detected = {
             'beneficiary': False,
             'tarjeta': False,
@@ -79,22 +128,25 @@ class UltimateGherkinConverter:
             'direccion_after': False
         }
         
-        step_contents = [self._clean_text(s.get('paso', '')) for s in steps]
+        clean = clean if clean is not None else StepTextCache()
+        step_contents = [clean[s.get('paso', '')] for s in steps]
 
         for i, content in enumerate(step_contents):
-            if any(re.search(pattern, content, re.IGNORECASE) 
-               for pattern in patterns['beneficiary']):
+            lowered = content.lower()
+            # Un único recorrido del paso clasifica todas las categorías
+            categories = {match.lastgroup for match in self._PATTERN_ENGINE.finditer(content)}
+
+            if 'beneficiary' in categories:
                 detected['beneficiary'] = True
-                if "nombre" in content.lower() and not detected['nombre_first']:
+                if "nombre" in lowered and not detected['nombre_first']:
                     detected['nombre_first'] = i
 
-            if "direcci" in content.lower() and detected['nombre_first'] is not False:
+            if "direcci" in lowered and detected['nombre_first'] is not False:
                 if i > detected['nombre_first']:
                     detected['direccion_after'] = True
 
             for category in ['tarjeta', 'cuenta', 'desglose']:
-                if any(re.search(pattern, content, re.IGNORECASE) 
-                      for pattern in patterns[category]):
+                if category in categories:
                     detected[category] = True
 
         return detected
@@ -108,10 +160,13 @@ class UltimateGherkinConverter:
         except:
             sorted_steps = list(raw_steps.values())
         
-        detected = self._detect_patterns(sorted_steps)
+        # Cada texto se limpia una sola vez aunque se consulte varias
+        clean = StepTextCache()
+        with METRICS.timer("conversor _detect_patterns"):
+            detected = self._detect_patterns(sorted_steps, clean)
 
         given = next(
-            (f"{self._clean_text(s['paso'])}" 
+            (clean[s['paso']] 
              for s in sorted_steps if s.get('paso')), 
             "Iniciar flujo"
         )
@@ -130,7 +185,7 @@ class UltimateGherkinConverter:
 
         # Manejo de validación vacía mejorado
         last_validation = next(
-            (self._clean_text(s.get('validacion', '')) 
+            (clean[s.get('validacion', '')] 
              for s in reversed(sorted_steps) 
              if self._is_valid_step(s.get('validacion', ''))),
             'El sistema regresa a la pantalla inicial VENTANILLA con el campo Clave habilitado'
@@ -146,12 +201,20 @@ class UltimateGherkinConverter:
     def _format_step(self, text: str) -> str:
         return '\n      '.join(textwrap.wrap(text, width=150, break_long_words=False))
 
+    def _module_name(self, module: str) -> str:
+        return _MODULE_SEPARATORS_RE.sub('_', module.split('-')[-1]).strip('_')
+
+    def _scenario_name(self, title: str) -> str:
+        return _TITLE_SEPARATORS_RE.sub(' ', title.split('_')[-1]).title()[:70]
+
     def _generate_feature(self, module: str, title: str, steps: Dict) -> str:
-        clean_module = re.sub(r'\W+', '_', module.split('-')[-1]).strip('_')
-        scenario_name = re.sub(r'[\W_]+', ' ', title.split('_')[-1]).title()[:70]
-        
+        return '\n'.join([
+            f"Feature: {self._module_name(module)}\n",
+            self._generate_scenario(self._scenario_name(title), steps)
+        ])
+
+    def _generate_scenario(self, scenario_name: str, steps: Dict) -> str:
         feature_lines = [
-            f"Feature: {clean_module}\n",
             f"  Scenario: {scenario_name}",
             f"    Given {self._format_step(steps['Given'])}"
         ]
@@ -166,42 +229,331 @@ class UltimateGherkinConverter:
         return '\n'.join(feature_lines)
 
     def _normalize_filename(self, filename: str) -> str:
-        name = filename.rsplit('.json', 1)[0]
-        normalized = unicodedata.normalize('NFKD', name)
-        ascii_name = normalized.encode('ASCII', 'ignore').decode('utf-8')
-        cleaned = re.sub(r'[^\w\s-]', '', ascii_name)
-        underscored = re.sub(r'[\s-]+', '_', cleaned)
-        final_name = re.sub(r'[._]+', '_', underscored).strip('_')
-        return f"{final_name}.feature"
-
-    def convert(self):
+        return normalize_filename(filename)
+
+    def _convert_file(self, filename: str) -> str:
+        """Convertir un JSON de input_dir y devolver la ruta del .feature generado"""
+        file_path = os.path.join(self.input_dir, filename)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return self.convert_record(data, filename)
+
+    def convert_record(self, data: Dict, source_name: str) -> str:
+        """
+        Convertir un registro ya cargado en memoria y escribir su .feature
+
+        Args:
+            data: Caso de prueba con 'Modulo', 'Titulo' y 'CasoPrueba'
+            source_name: Nombre del JSON de origen; define el nombre del .feature
+        """
+        with METRICS.timer("conversor _process_steps", source_name):
+            processed = self._process_steps(data.get("CasoPrueba", {}))
+        feature_content = self._generate_feature(
+            module=data.get("Modulo", "Modulo_Principal"),
+            title=data.get("Titulo", "Escenario_Principal"),
+            steps=processed
+        )
+
+        feature_filename = self.filename_prefix + self._normalize_filename(source_name)
+        output_file = os.path.join(self.output_dir, feature_filename)
+        
+        with METRICS.timer("conversor escritura .feature", source_name):
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(feature_content)
+        return output_file
+
+    def build_scenario(self, data: Dict, source_name: str) -> Dict[str, Any]:
+        """Escenario de un registro para la salida agrupada por módulo"""
+        return {
+            "source": source_name,
+            "module": self._module_name(data.get("Modulo", "Modulo_Principal")),
+            "name": self._scenario_name(data.get("Titulo", "Escenario_Principal")),
+            "steps": self._process_steps(data.get("CasoPrueba", {}))
+        }
+
+    def write_module_features(self, scenarios: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Escribir un .feature por módulo con todos sus escenarios
+
+        Los escenarios se ordenan por archivo de origen y los nombres repetidos
+        dentro de un módulo reciben un sufijo " (2)", " (3)"..., de modo que la
+        salida es idéntica entre ejecuciones con la misma entrada. Cada archivo
+        se arma en memoria y se escribe de una sola vez.
+
+        Returns:
+            Ruta del .feature generado por cada módulo
+        """
+        modules = {}
+        for scenario in sorted(scenarios, key=lambda s: s["source"]):
+            modules.setdefault(scenario["module"], []).append(scenario)
+
+        written = {}
+        used_files = set()
+        for module in sorted(modules):
+            base = self._normalize_filename(module or "Modulo_Principal")[:-len(".feature")]
+            feature_filename = f"{self.filename_prefix}{base}.feature"
+            suffix = 1
+            # Módulos distintos pueden normalizarse al mismo nombre de archivo
+            while feature_filename in used_files:
+                suffix += 1
+                feature_filename = f"{self.filename_prefix}{base}_{suffix}.feature"
+            used_files.add(feature_filename)
+
+            blocks = [f"Feature: {module}\n"]
+            used_names = set()
+            for scenario in modules[module]:
+                name, copy = scenario["name"], 1
+                while name in used_names:
+                    copy += 1
+                    name = f"{scenario['name']} ({copy})"
+                used_names.add(name)
+                blocks.append(self._generate_scenario(name, scenario["steps"]) + "\n")
+
+            output_file = os.path.join(self.output_dir, feature_filename)
+            with METRICS.timer("conversor escritura .feature", feature_filename):
+                with open(output_file, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+                    f.write('\n'.join(blocks))
+            written[module] = output_file
+
+        return written
+
+    def convert_by_module(
+        self,
+        workers: Optional[int] = 1,
+        chunk_size: int = 32,
+        input_dir: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        filename_prefix: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Convertir todos los JSON de input_dir en un .feature por módulo
+
+        Siempre reconstruye los módulos desde la carpeta completa, así que no
+        usa el manifiesto incremental. Los argumentos son los de convert().
+
+        Returns:
+            Resumen con 'generados' (archivos), 'escenarios' y 'errores' ({archivo: mensaje})
+        """
+        if input_dir is not None:
+            self.input_dir = input_dir
+        if output_dir is not None:
+            self.output_dir = output_dir
+        if filename_prefix is not None:
+            self.filename_prefix = filename_prefix
+
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
 
-        for filename in os.listdir(self.input_dir):
-            if filename.endswith('.json'):
-                print(f"Procesando archivo: {filename}")
+        filenames = [f for f in os.listdir(self.input_dir) if f.endswith('.json')]
+        workers = workers or os.cpu_count() or 1
+        summary = {"generados": 0, "escenarios": 0, "errores": {}}
+        scenarios = []
+
+        for filename, scenario, error in self._iter_conversions(
+            filenames, workers, chunk_size, task=_scenario_in_worker
+        ):
+            if error is None:
+                scenarios.append(scenario)
+            else:
+                summary["errores"][filename] = error
+                print(f"Error procesando {filename}: {error}")
+
+        for output_file in self.write_module_features(scenarios).values():
+            print(f"Archivo generado: {output_file}")
+            summary["generados"] += 1
+        summary["escenarios"] = len(scenarios)
+        return summary
+
+    def _iter_conversions(self, filenames: List[str], workers: int, chunk_size: int, task=None):
+        """Convertir archivos en serie o en el pool y producir (archivo, salida, error)"""
+        task = task or _convert_in_worker
+        if workers > 1 and len(filenames) > chunk_size:
+            # Cada proceso recibe una copia del conversor (solo rutas y prefijo).
+            # 'spawn' también en Linux: un fork mientras otros hilos (descargas de
+            # batch.py) tienen tomado un lock, como el de METRICS, lo deja tomado
+            # para siempre en el proceso hijo
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                yield from executor.map(
+                    task,
+                    repeat(self),
+                    filenames,
+                    chunksize=chunk_size
+                )
+        else:
+            for filename in filenames:
+                yield task(self, filename)
+
+    def convert(
+        self,
+        workers: Optional[int] = 1,
+        chunk_size: int = 32,
+        incremental: bool = False,
+        input_dir: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        filename_prefix: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Convertir todos los JSON de input_dir a .feature
+        
+        Las carpetas y el prefijo pueden indicarse en cada llamada para
+        reutilizar la misma instancia entre ejecuciones.
+        
+        Args:
+            workers: Procesos a usar; 1 convierte en serie y None usa todos los núcleos
+            chunk_size: Archivos que recibe cada proceso por envío
+            incremental: Reconvertir solo los JSON cuyo contenido o cuyas reglas
+                (RULES_VERSION) cambiaron, según el manifiesto de output_dir, y
+                eliminar los .feature cuyo JSON de origen ya no existe
+            input_dir: Carpeta de entrada para esta y las siguientes llamadas
+            output_dir: Carpeta de salida para esta y las siguientes llamadas
+            filename_prefix: Prefijo de los .feature para esta y las siguientes llamadas
+            
+        Returns:
+            Resumen con 'generados', 'omitidos', 'eliminados' y 'errores' ({archivo: mensaje})
+        """
+        if input_dir is not None:
+            self.input_dir = input_dir
+        if output_dir is not None:
+            self.output_dir = output_dir
+        if filename_prefix is not None:
+            self.filename_prefix = filename_prefix
+
+        if not os.path.exists(self.output_dir):
+            os.makedirs(self.output_dir)
+
+        filenames = [f for f in os.listdir(self.input_dir) if f.endswith('.json')]
+        workers = workers or os.cpu_count() or 1
+        summary = {"generados": 0, "omitidos": 0, "eliminados": 0, "errores": {}}
+
+        if incremental:
+            manifest = self._load_manifest()
+            entries = manifest["sources"].setdefault(self._manifest_key(), {})
+            hashes = {filename: self._file_hash(filename) for filename in filenames}
+            summary["eliminados"] = self._remove_orphans(entries, set(filenames))
+            
+            pending = [
+                filename for filename in filenames
+                if entries.get(filename, {}).get("hash") != hashes[filename]
+                or not os.path.exists(os.path.join(self.output_dir, entries[filename]["feature"]))
+            ]
+            summary["omitidos"] = len(filenames) - len(pending)
+        else:
+            pending = filenames
+
+        for filename, output_file, error in self._iter_conversions(pending, workers, chunk_size):
+            print(f"Procesando archivo: {filename}")
+            if error is None:
+                summary["generados"] += 1
+                print(f"Archivo generado: {output_file}")
+                if incremental:
+                    entries[filename] = {
+                        "hash": hashes[filename],
+                        "feature": os.path.basename(output_file)
+                    }
+            else:
+                summary["errores"][filename] = error
+                print(f"Error procesando {filename}: {error}")
+                if incremental:
+                    entries.pop(filename, None)
+
+        if incremental:
+            self._save_manifest(manifest)
+            print(
+                f"Conversión incremental: {summary['generados']} generados, "
+                f"{summary['omitidos']} sin cambios, {summary['eliminados']} eliminados"
+            )
+        return summary
+
+    def record_conversions(self, input_dir: str, features: Dict[str, str]) -> None:
+        """
+        Registrar en el manifiesto incremental .feature generados fuera de convert()
+
+        La conversión en streaming (FeaturePipeline) escribe cada .feature desde
+        memoria; registrarlos evita que el siguiente convert(incremental=True)
+        los genere de nuevo y deja que la limpieza de huérfanos los alcance.
+
+        Args:
+            input_dir: Carpeta con los JSON de origen ya guardados
+            features: {nombre del JSON: ruta del .feature generado}
+        """
+        if not features:
+            return
+        self.input_dir = input_dir
+
+        with _MANIFEST_LOCK:
+            manifest = self._load_manifest()
+            entries = manifest["sources"].setdefault(self._manifest_key(), {})
+            for filename, output_file in features.items():
                 try:
-                    file_path = os.path.join(self.input_dir, filename)
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    processed = self._process_steps(data.get("CasoPrueba", {}))
-                    feature_content = self._generate_feature(
-                        module=data.get("Modulo", "Modulo_Principal"),
-                        title=data.get("Titulo", "Escenario_Principal"),
-                        steps=processed
-                    )
-
-                    feature_filename = self._normalize_filename(filename)
-                    output_file = os.path.join(self.output_dir, feature_filename)
-                    
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        f.write(feature_content)
-                    print(f"Archivo generado: {output_file}")    
-
-                except Exception as e:
-                    print(f"Error procesando {filename}: {str(e)}")
+                    entries[filename] = {
+                        "hash": self._file_hash(filename),
+                        "feature": os.path.basename(output_file)
+                    }
+                except OSError:
+                    entries.pop(filename, None)
+            self._save_manifest(manifest)
+
+    def _manifest_key(self) -> str:
+        """Sección del manifiesto: varias carpetas de entrada pueden compartir output_dir"""
+        return f"{os.path.normcase(os.path.abspath(self.input_dir))}|{self.filename_prefix}"
+
+    def _file_hash(self, filename: str) -> str:
+        with open(os.path.join(self.input_dir, filename), 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Leer el manifiesto; se descarta si las reglas del conversor cambiaron"""
+        manifest_path = os.path.join(self.output_dir, MANIFEST_FILE)
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get("rules_version") == self.RULES_VERSION:
+                return manifest
+            print(f"Reglas actualizadas a {self.RULES_VERSION}: se reconvierte todo")
+        except (OSError, ValueError):
+            pass
+        return {"rules_version": self.RULES_VERSION, "sources": {}}
+
+    def _save_manifest(self, manifest: Dict[str, Any]) -> None:
+        manifest_path = os.path.join(self.output_dir, MANIFEST_FILE)
+        tmp_path = manifest_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, manifest_path)
+
+    def _remove_orphans(self, entries: Dict[str, Dict], current: set) -> int:
+        """Eliminar los .feature cuyo JSON de origen desapareció"""
+        removed = 0
+        for filename in [name for name in entries if name not in current]:
+            feature = entries.pop(filename)["feature"]
+            # Otro JSON vigente puede generar el mismo .feature
+            if any(entry["feature"] == feature for entry in entries.values()):
+                continue
+            try:
+                os.remove(os.path.join(self.output_dir, feature))
+                removed += 1
+                print(f"Archivo eliminado: {feature}")
+            except FileNotFoundError:
+                pass
+        return removed
+
+def _convert_in_worker(converter: UltimateGherkinConverter, filename: str):
+    """Punto de entrada de cada archivo en el pool de procesos (debe ser picklable)"""
+    try:
+        return filename, converter._convert_file(filename), None
+    except Exception as e:
+        return filename, None, str(e)
+
+def _scenario_in_worker(converter: UltimateGherkinConverter, filename: str):
+    """Como _convert_in_worker, pero devuelve el escenario sin escribirlo"""
+    try:
+        with open(os.path.join(converter.input_dir, filename), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return filename, converter.build_scenario(data, filename), None
+    except Exception as e:
+        return filename, None, str(e)
 
 if __name__ == "__main__":
     converter = UltimateGherkinConverter(
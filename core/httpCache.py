@@ -0,0 +1,153 @@
+"""
+Copyright (c) 2025 Alejandro Ramírez
+Bajo la Licencia de Autor Restringida (LAR) v1.0
+Más detalles en LICENSE
+"""
+
+import json
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+class ResponseCache:
+    """
+    Caché en disco de respuestas GET, direccionada por hash de URL y parámetros
+
+    Cada entrada guarda el cuerpo (<clave>.body) y sus metadatos (<clave>.meta):
+    código, cabeceras, ETag/Last-Modified y momento de la descarga. Si el
+    servidor envió validadores, la entrada se revalida en cada uso con
+    If-None-Match/If-Modified-Since; si no, se sirve sin tocar la red mientras
+    tenga menos de 'ttl' segundos y después se descarga de nuevo. Al superar
+    'max_bytes' se eliminan las entradas usadas hace más tiempo (LRU por fecha
+    de acceso).
+    """
+
+    def __init__(self, cache_dir: str, ttl: float = 24 * 3600, max_bytes: int = 512 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = sum(f.stat().st_size for f in self.cache_dir.glob("*.body"))
+        logger.info(
+            "Caché HTTP en %s | %.1f MB en uso | TTL: %ds",
+            self.cache_dir, self._size / (1024 * 1024), self.ttl
+        )
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict] = None) -> str:
+        """Clave estable para una URL y sus parámetros"""
+        canonical = json.dumps(
+            [url, sorted((str(k), str(v)) for k, v in (params or {}).items())],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str):
+        return self.cache_dir / f"{key}.meta", self.cache_dir / f"{key}.body"
+
+    def load(self, key: str) -> Optional[Dict]:
+        """Leer una entrada; devuelve sus metadatos con el cuerpo en 'body'"""
+        meta_path, body_path = self._paths(key)
+        with self._lock:
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                meta["body"] = body_path.read_bytes()
+                # Registrar el acceso para la expulsión LRU
+                body_path.touch()
+            except (OSError, ValueError):
+                return None
+        return meta
+
+    def is_fresh(self, entry: Dict) -> bool:
+        return time.time() - entry.get("stored_at", 0) < self.ttl
+
+    @staticmethod
+    def validators(entry: Dict) -> Dict[str, str]:
+        """Cabeceras condicionales para revalidar una entrada"""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, key: str, response: requests.Response) -> None:
+        """Guardar una respuesta 200"""
+        meta_path, body_path = self._paths(key)
+        body = response.content
+        meta = {
+            "url": response.url,
+            "status_code": response.status_code,
+            "headers": {"Content-Type": response.headers.get("Content-Type", "")},
+            "encoding": response.encoding,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "stored_at": time.time()
+        }
+
+        with self._lock:
+            try:
+                previous = body_path.stat().st_size if body_path.exists() else 0
+                body_path.write_bytes(body)
+                with open(meta_path, "w", encoding="utf-8") as f:
+                    json.dump(meta, f)
+                self._size += len(body) - previous
+            except OSError as e:
+                logger.warning("No se pudo guardar en caché %s: %s", response.url, str(e))
+                return
+
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def refresh(self, key: str) -> None:
+        """Renovar el TTL de una entrada revalidada con 304"""
+        meta_path, _ = self._paths(key)
+        with self._lock:
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                meta["stored_at"] = time.time()
+                with open(meta_path, "w", encoding="utf-8") as f:
+                    json.dump(meta, f)
+            except (OSError, ValueError):
+                pass
+
+    def _evict(self) -> None:
+        """Eliminar las entradas menos usadas hasta quedar al 90% del límite"""
+        bodies = sorted(self.cache_dir.glob("*.body"), key=lambda p: p.stat().st_mtime)
+        target = self.max_bytes * 0.9
+        removed = 0
+
+        for body_path in bodies:
+            if self._size <= target:
+                break
+            try:
+                size = body_path.stat().st_size
+                body_path.unlink()
+                body_path.with_suffix(".meta").unlink(missing_ok=True)
+                self._size -= size
+                removed += 1
+            except OSError:
+                continue
+
+        logger.info("Caché HTTP: %d entradas expulsadas (LRU)", removed)
+
+    @staticmethod
+    def to_response(entry: Dict) -> requests.Response:
+        """Reconstruir un requests.Response a partir de una entrada"""
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response._content = entry["body"]
+        response.headers = CaseInsensitiveDict(entry.get("headers", {}))
+        response.encoding = entry.get("encoding")
+        response.url = entry.get("url", "")
+        return response
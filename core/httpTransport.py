@@ -0,0 +1,250 @@
+"""
+Copyright (c) 2025 Alejandro Ramírez
+Bajo la Licencia de Autor Restringida (LAR) v1.0
+Más detalles en LICENSE
+"""
+
+import time
+import random
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from core.httpCache import ResponseCache
+    from core.metrics import METRICS, endpoint_name
+except ImportError:  # Ejecución directa desde core/
+    from httpCache import ResponseCache
+    from metrics import METRICS, endpoint_name
+
+logger = logging.getLogger(__name__)
+
+# Códigos que se reintentan automáticamente
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Códigos que indican que el servidor pide bajar el ritmo
+THROTTLE_STATUSES = {429, 503}
+
+class RateLimiter:
+    """
+    Limitador de solicitudes por segundo, seguro entre hilos y adaptativo
+
+    Reduce el ritmo a la mitad cuando el servidor responde 429/503 y lo
+    recupera poco a poco con cada respuesta correcta (AIMD). El techo
+    ceiling_per_second (por defecto el ritmo inicial) nunca se supera: el
+    ajuste solo retrocede desde él y vuelve a subir hasta él.
+    """
+
+    def __init__(
+        self,
+        max_per_second: float,
+        min_per_second: float = 0.5,
+        ceiling_per_second: Optional[float] = None,
+        increase_step: float = 0.1
+    ):
+        self.rate = max_per_second if max_per_second and max_per_second > 0 else 0.0
+        self.min_rate = min_per_second
+        self.max_rate = ceiling_per_second if ceiling_per_second and ceiling_per_second > 0 else self.rate
+        if self.rate and self.max_rate:
+            self.rate = min(self.rate, self.max_rate)
+        self.increase_step = increase_step
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def wait(self) -> None:
+        """Bloquear hasta que corresponda enviar la siguiente solicitud"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            if self.rate:
+                self._next_slot = slot + 1.0 / self.rate
+        if slot > now:
+            time.sleep(slot - now)
+
+    def penalize(self, pause: float = 0.0) -> None:
+        """Reducir el ritmo y pausar a todos los hilos durante 'pause' segundos"""
+        with self._lock:
+            if self.rate:
+                self.rate = max(self.min_rate, self.rate / 2)
+            self._next_slot = max(self._next_slot, time.monotonic() + pause)
+            logger.warning("Servidor saturado: ritmo reducido a %.2f req/s", self.rate)
+
+    def reward(self) -> None:
+        """Aumentar gradualmente el ritmo tras una respuesta correcta"""
+        if not self.rate or self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+class HttpTransport:
+    """
+    Capa HTTP compartida por los extractores
+
+    Envuelve un requests.Session con pool de conexiones configurable,
+    limitador de ritmo adaptativo y reintentos con backoff exponencial y
+    jitter para 429/5xx y errores de red, respetando Retry-After. Con una
+    ResponseCache, get(..., cache=True) sirve y revalida respuestas desde disco.
+
+    requests_per_second es el ritmo inicial y max_requests_per_second (por
+    defecto el mismo valor) el tope que el limitador adaptativo nunca supera.
+    Varios transportes pueden compartir un mismo 'limiter' (ritmo por host) y
+    un semáforo 'slots' que acota las solicitudes en vuelo entre todos ellos.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = 10.0,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_max: float = 60.0,
+        pool_connections: int = 10,
+        pool_maxsize: int = 16,
+        timeout: float = 30,
+        verify: bool = True,
+        cache: Optional[ResponseCache] = None,
+        limiter: Optional[RateLimiter] = None,
+        slots: Optional[threading.Semaphore] = None,
+        max_requests_per_second: Optional[float] = None
+    ):
+        self.cache = cache
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.limiter = limiter or RateLimiter(
+            requests_per_second,
+            ceiling_per_second=max_requests_per_second or requests_per_second
+        )
+        self.slots = slots
+
+        self.session = requests.Session()
+        self.session.verify = verify
+        # Los reintentos los gestiona request(); el adaptador solo reparte conexiones
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _backoff(self, attempt: int) -> float:
+        """Backoff exponencial con jitter completo"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Interpretar Retry-After en segundos o como fecha HTTP"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return min(self.backoff_max, max(0.0, float(value)))
+        except ValueError:
+            pass
+        try:
+            moment = parsedate_to_datetime(value)
+            delay = (moment - datetime.now(timezone.utc)).total_seconds()
+            return min(self.backoff_max, max(0.0, delay))
+        except (TypeError, ValueError):
+            return None
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Enviar una sola solicitud ocupando un cupo de 'slots', si existe"""
+        if self.slots is None:
+            return self.session.request(method, url, **kwargs)
+        # El cupo se libera antes de cualquier espera de reintento
+        with self.slots:
+            return self.session.request(method, url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Enviar una solicitud con control de ritmo y reintentos
+
+        Devuelve la última respuesta obtenida aunque siga siendo un error
+        reintentable; las excepciones de red se relanzan al agotar los reintentos.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        stage = f"http {endpoint_name(method, url)}"
+
+        for attempt in range(self.max_retries + 1):
+            self.limiter.wait()
+            start = time.perf_counter()
+            try:
+                response = self._send(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                METRICS.record(stage, time.perf_counter() - start, url)
+                METRICS.count("http errores de red")
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(
+                    "Error de red en %s %s: %s | Reintento %d/%d en %.1fs",
+                    method, url, str(e), attempt + 1, self.max_retries, delay
+                )
+                time.sleep(delay)
+                continue
+            METRICS.record(stage, time.perf_counter() - start, url)
+
+            if response.status_code != 200:
+                METRICS.count(f"http {response.status_code}")
+            if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                if response.status_code not in RETRY_STATUSES:
+                    self.limiter.reward()
+                return response
+
+            retry_after = self._retry_after(response)
+            delay = retry_after if retry_after is not None else self._backoff(attempt)
+            logger.warning(
+                "Respuesta %d en %s %s | Reintento %d/%d en %.1fs",
+                response.status_code, method, url, attempt + 1, self.max_retries, delay
+            )
+
+            if response.status_code in THROTTLE_STATUSES:
+                # La pausa la aplica el limitador a todos los hilos en el próximo wait()
+                self.limiter.penalize(delay)
+            else:
+                time.sleep(delay)
+
+        return response
+
+    def get(self, url: str, cache: bool = False, **kwargs) -> requests.Response:
+        """
+        GET con caché opcional
+
+        Una entrada con ETag o Last-Modified se revalida siempre con una
+        solicitud condicional (un 304 evita descargar el cuerpo); sin
+        validadores se sirve sin red mientras no supere el TTL.
+
+        Args:
+            url: URL a consultar
+            cache: Usar la caché de respuestas del transporte, si existe
+        """
+        if not cache or self.cache is None:
+            return self.request("GET", url, **kwargs)
+
+        key = self.cache.key(url, kwargs.get("params"))
+        entry = self.cache.load(key)
+        validators = self.cache.validators(entry) if entry else {}
+        if entry and not validators and self.cache.is_fresh(entry):
+            METRICS.count("http caché aciertos")
+            logger.debug("Caché HTTP: acierto para %s", url)
+            return self.cache.to_response(entry)
+
+        if validators:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **validators}
+
+        response = self.request("GET", url, **kwargs)
+        if response.status_code == 304 and entry:
+            METRICS.count("http caché revalidados")
+            logger.debug("Caché HTTP: revalidado %s", url)
+            self.cache.refresh(key)
+            return self.cache.to_response(entry)
+        if response.status_code == 200:
+            self.cache.store(key, response)
+        return response
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
@@ -5,16 +5,32 @@ Más detalles en LICENSE
 """ 
 
 import json
-import time
 import requests
 import logging
-import configparser
 from base64 import b64encode
-from typing import Dict, Optional, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from typing import Callable, Dict, Optional, List, Iterable, Iterator
 from pathlib import Path
 import sys
 import os
 
+try:
+    from core.checkpoint import CheckpointJournal, PageTracker
+    from core.config import load_config
+    from core.httpTransport import HttpTransport
+    from core.metrics import METRICS
+    from core.runControl import RunControl
+except ImportError:  # Ejecución directa desde core/
+    from checkpoint import CheckpointJournal, PageTracker
+    from config import load_config
+    from httpTransport import HttpTransport
+    from metrics import METRICS
+    from runControl import RunControl
+
 # Configuración avanzada de logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,13 +39,34 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Campos que trae export_project por defecto: los mismos que get_issue, sin expansiones
+DEFAULT_SEARCH_FIELDS = "*all"
+# Páginas de búsqueda simultáneas una vez conocido el total (orden created ASC)
+SEARCH_PAGE_WORKERS = 4
+
+# Estado de la sincronización incremental (sin extensión .json para que el
+# conversor no lo confunda con un issue)
+SYNC_STATE_FILE = ".jira_sync_state"
+# Margen aplicado a la marca cuando no se conoce la zona horaria del usuario
+SYNC_TZ_MARGIN = timedelta(hours=14)
+# Tolerancia a la diferencia de reloj con JIRA al fijar el límite superior
+SYNC_CLOCK_SKEW = timedelta(minutes=5)
+# Formato de 'updated' en JIRA, también usado para la marca guardada
+JIRA_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+def project_jql(project_key: str) -> str:
+    """Consulta JQL con todos los issues de un proyecto en orden de creación"""
+    return f"project = {project_key} ORDER BY created ASC"
+
 class JiraExtractor:
-    def __init__(self, url: str, email: str, api_token: str):
+    def __init__(self, url: str, email: str, api_token: str, transport: Optional[HttpTransport] = None):
         self.url = url.rstrip('/')
         self.email = email
         self.api_token = api_token
-        self.session = requests.Session()
+        self.transport = transport or HttpTransport()
+        self.session = self.transport.session
         self.auth_header = self._get_auth_header()
+        self.time_zone = None
         logger.info("Inicializado extractor JIRA para: %s", self.url)
 
     def _get_auth_header(self) -> str:
@@ -39,7 +76,7 @@ class JiraExtractor:
 
     def check_connection(self) -> bool:
         try:
-            response = self.session.get(
+            response = self.transport.get(
                 f"{self.url}/rest/api/3/myself",
                 headers={"Authorization": self.auth_header},
                 timeout=10
@@ -47,6 +84,7 @@ class JiraExtractor:
             
             if response.status_code == 200:
                 user_data = response.json()
+                self.time_zone = user_data.get('timeZone')
                 logger.info(
                     "Conexión exitosa | Usuario: %s | Correo: %s",
                     user_data.get('displayName'),
@@ -71,10 +109,11 @@ class JiraExtractor:
     def get_issue(self, issue_id: str) -> Optional[Dict]:
         try:
             logger.info("Solicitando issue: %s", issue_id)
-            response = self.session.get(
+            response = self.transport.get(
                 f"{self.url}/rest/api/3/issue/{issue_id}",
                 headers={"Authorization": self.auth_header},
-                params={"expand": "renderedFields,names"}
+                params={"expand": "renderedFields,names"},
+                cache=True
             )
             
             if response.status_code == 200:
@@ -96,59 +135,146 @@ class JiraExtractor:
             logger.exception("Error crítico obteniendo issue %s: %s", issue_id, str(e))
             return None
 
-    def get_all_issues(self, project_key: str) -> Optional[List[str]]:
+    def _search_page(
+        self,
+        jql: str,
+        fields: str,
+        expand: Optional[str],
+        start_at: int,
+        page_size: int
+    ) -> Dict:
+        """Pedir una página de /rest/api/3/search; lanza HTTPError si no es 200"""
+        params = {
+            "jql": jql,
+            "startAt": start_at,
+            "maxResults": page_size,
+            "fields": fields
+        }
+        if expand:
+            params["expand"] = expand
+
+        response = self.transport.get(
+            f"{self.url}/rest/api/3/search",
+            headers={"Authorization": self.auth_header},
+            params=params,
+            timeout=15
+        )
+
+        if response.status_code != 200:
+            logger.error(
+                "Error en búsqueda JQL | Código: %d | Respuesta: %s",
+                response.status_code,
+                response.text[:200] + "..." if len(response.text) > 200 else response.text
+            )
+            raise requests.exceptions.HTTPError(
+                f"Respuesta inesperada de JIRA: {response.status_code}",
+                response=response
+            )
+
+        data = response.json()
+        logger.debug(
+            "Procesado lote %d-%d de %d",
+            start_at,
+            start_at + len(data.get("issues", [])),
+            data.get("total", 0)
+        )
+        return data
+
+    def iter_search_pages(
+        self,
+        jql: str,
+        fields: str = "key,created",
+        expand: Optional[str] = None,
+        page_size: int = 100,
+        start_at: int = 0,
+        max_workers: int = 1
+    ) -> Iterator[Dict]:
+        """
+        Recorrer las páginas de /rest/api/3/search para una consulta JQL
+
+        Con max_workers > 1, tras la primera página (que informa 'total') se
+        piden en paralelo los desplazamientos restantes, bajo el limitador del
+        transporte, y las páginas se entregan en orden de desplazamiento. Solo
+        es seguro con un orden estable como 'created ASC': si el orden cambia
+        durante la consulta (ej: 'updated'), los desplazamientos se corren.
+
+        Args:
+            jql: Consulta JQL a ejecutar
+            fields: Campos a solicitar en cada issue (ej: "*all", "summary,status")
+            expand: Expansiones opcionales (ej: "renderedFields,names")
+            page_size: Issues por página (JIRA limita a 100)
+            start_at: Desplazamiento inicial de la búsqueda
+            max_workers: Páginas pedidas a la vez después de la primera
+
+        Yields:
+            Respuesta JSON de cada página, incluyendo 'total' e 'issues'
+
+        Raises:
+            requests.exceptions.HTTPError: Si JIRA responde con un código distinto de 200
+        """
+        data = self._search_page(jql, fields, expand, start_at, page_size)
+        total = data.get('total', 0)
+        logger.info("Total de issues detectados: %d", total)
+        yield data
+
+        # JIRA puede devolver menos issues por página que los pedidos
+        step = min(page_size, data.get('maxResults') or page_size)
+
+        if max_workers > 1:
+            yield from self._search_pages_parallel(
+                jql, fields, expand, range(data.get('startAt', start_at) + step, total, step),
+                step, max_workers
+            )
+            return
+
+        while data.get("issues") and data.get('startAt', 0) + data.get('maxResults', 0) < total:
+            start_at = data.get('startAt', start_at) + len(data["issues"])
+            data = self._search_page(jql, fields, expand, start_at, page_size)
+            yield data
+
+    def _search_pages_parallel(
+        self,
+        jql: str,
+        fields: str,
+        expand: Optional[str],
+        offsets: Iterable[int],
+        page_size: int,
+        max_workers: int
+    ) -> Iterator[Dict]:
+        """Pedir varias páginas a la vez y entregarlas en orden de desplazamiento"""
+        logger.info(
+            "Búsqueda paginada concurrente | Hilos: %d | Límite: %.2f req/s",
+            max_workers,
+            self.transport.limiter.rate
+        )
+        max_pending = max_workers * 2
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Futures en orden de desplazamiento; se espera siempre al primero
+            window = deque()
+            try:
+                for offset in offsets:
+                    window.append(executor.submit(self._search_page, jql, fields, expand, offset, page_size))
+                    if len(window) >= max_pending:
+                        yield window.popleft().result()
+
+                while window:
+                    yield window.popleft().result()
+            finally:
+                # Ante un error o un cierre anticipado, las páginas en cola no se piden
+                for future in window:
+                    future.cancel()
+
+    def get_all_issues(self, project_key: str, max_workers: int = SEARCH_PAGE_WORKERS) -> Optional[List[str]]:
         try:
-            issues = []
-            start_at = 0
-            max_results = 100
-            total = None
-            
             logger.info("Iniciando extracción masiva para proyecto: %s", project_key)
-            
-            while True:
-                params = {
-                    "jql": f"project = {project_key} ORDER BY created ASC",
-                    "startAt": start_at,
-                    "maxResults": max_results,
-                    "fields": "key,created"
-                }
-                
-                response = self.session.get(
-                    f"{self.url}/rest/api/3/search",
-                    headers={"Authorization": self.auth_header},
-                    params=params,
-                    timeout=15
-                )
-                
-                if response.status_code != 200:
-                    logger.error(
-                        "Error en extracción masiva | Código: %d | Respuesta: %s",
-                        response.status_code,
-                        response.text[:200] + "..." if len(response.text) > 200 else response.text
-                    )
-                    return None
-                    
-                data = response.json()
-                if total is None:
-                    total = data.get('total', 0)
-                    logger.info("Total de issues detectados: %d", total)
-                    
-                batch = [issue["key"] for issue in data.get("issues", [])]
-                issues.extend(batch)
-                logger.debug(
-                    "Procesado lote %d-%d | Total acumulado: %d",
-                    start_at,
-                    start_at + max_results,
-                    len(issues)
-                )
-                
-                if data.get('startAt', 0) + data.get('maxResults', 0) >= total:
-                    break
-                    
-                start_at += max_results
-                # Throttling para evitar bloqueos
-                time.sleep(0.5)
-            
+
+            issues = [
+                issue["key"]
+                for page in self.iter_search_pages(project_jql(project_key), max_workers=max_workers)
+                for issue in page.get("issues", [])
+            ]
+
             logger.info("Extracción masiva completada | Issues obtenidos: %d", len(issues))
             return issues
             
@@ -159,7 +285,206 @@ class JiraExtractor:
             logger.exception("Error crítico en extracción masiva: %s", str(e))
             return None
 
-    def save_issue(self, issue: Dict, output_dir: str = "jira_issues") -> None:
+    def export_project(
+        self,
+        project_key: str,
+        output_dir: str = "jira_issues",
+        fields: str = DEFAULT_SEARCH_FIELDS,
+        expand: Optional[str] = None,
+        journal: Optional[CheckpointJournal] = None,
+        progress: Optional[Callable[[int, int, str], None]] = None,
+        sink: Optional[Callable[[Dict, Optional[Callable[[], None]]], None]] = None,
+        control: Optional[RunControl] = None,
+        max_workers: int = SEARCH_PAGE_WORKERS
+    ) -> int:
+        """
+        Exportar todos los issues de un proyecto, con reanudación opcional
+
+        Cada página de búsqueda trae ya los issues completos, sin una segunda
+        descarga por issue con get_issue.
+        Con un journal, la búsqueda continúa desde el último cursor registrado,
+        se omiten los issues ya guardados y el journal se elimina al terminar.
+        Un issue se marca en el journal solo cuando está guardado, y el cursor
+        no pasa de la primera página con issues sin guardar.
+
+        Args:
+            project_key: Clave del proyecto (ej: BT115)
+            output_dir: Carpeta base, igual que en save_issue (<output_dir>/<PROYECTO>)
+            fields: Campos a solicitar en la búsqueda
+            expand: Expansiones opcionales (ej: "renderedFields,names")
+            journal: Journal de checkpoint opcional (CheckpointJournal.for_run)
+            progress: Callback opcional (posición, total, clave) por cada issue
+            sink: Destino de cada issue en lugar de save_issue, llamado como
+                sink(issue, on_saved); debe invocar on_saved() cuando el issue
+                esté guardado (ej: el submit() de un FeaturePipeline)
+            control: Pausa y cancelación entre issues; al cancelar se lanza
+                RunCancelled y el journal conserva el avance
+            max_workers: Páginas de búsqueda pedidas a la vez (1 = secuencial)
+
+        Returns:
+            Número de issues procesados en esta ejecución
+        """
+        start_at = int(journal.cursor or 0) if journal else 0
+        tracker = PageTracker(journal) if journal else None
+        extracted = 0
+
+        try:
+            for page in self.iter_search_pages(
+                project_jql(project_key), fields=fields, expand=expand,
+                start_at=start_at, max_workers=max_workers
+            ):
+                total = page.get("total", 0)
+                page_start = page.get("startAt", start_at)
+                issues = page.get("issues", [])
+                pending = [
+                    (position, issue) for position, issue in enumerate(issues, page_start + 1)
+                    if not (journal and journal.is_done(issue.get("key")))
+                ]
+                if tracker:
+                    tracker.open_page(
+                        page_start, page_start + len(issues),
+                        [issue.get("key") for _, issue in pending]
+                    )
+
+                for position, issue in pending:
+                    issue_key = issue.get("key")
+                    if control:
+                        control.checkpoint()
+                    on_saved = partial(tracker.mark_done, issue_key) if tracker else None
+                    if sink:
+                        sink(issue, on_saved)
+                    elif self.save_issue(issue, output_dir) and on_saved:
+                        on_saved()
+                    extracted += 1
+                    if progress:
+                        progress(position, total, issue_key)
+        except BaseException:
+            if journal:
+                journal.close()
+            raise
+
+        if journal:
+            journal.complete()
+        logger.info("Exportación de %s completada | Issues guardados: %d", project_key, extracted)
+        return extracted
+
+    def load_sync_mark(self, state_dir: str) -> Optional[str]:
+        """Leer la marca de agua (límite superior de 'updated') de una sincronización previa"""
+        state_file = Path(state_dir) / SYNC_STATE_FILE
+        try:
+            with open(state_file, "r", encoding="utf-8") as f:
+                return json.load(f).get("updated")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Estado de sincronización ilegible en %s: %s", state_file, str(e))
+            return None
+
+    def save_sync_mark(self, state_dir: str, project_key: str, updated: str) -> None:
+        """Guardar la marca de agua de la sincronización de un proyecto"""
+        state_file = Path(state_dir) / SYNC_STATE_FILE
+        Path(state_dir).mkdir(parents=True, exist_ok=True)
+
+        tmp_file = state_file.with_name(state_file.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"project": project_key, "updated": updated}, f, indent=2)
+        os.replace(tmp_file, state_file)
+
+    def _jql_timestamp(self, updated: str) -> str:
+        """Convertir un 'updated' ISO de JIRA al formato de fecha de JQL"""
+        moment = datetime.strptime(updated, JIRA_TIMESTAMP_FORMAT)
+
+        # JQL interpreta las fechas en la zona horaria del usuario autenticado
+        try:
+            tz = ZoneInfo(self.time_zone) if self.time_zone else None
+        except (ZoneInfoNotFoundError, ValueError):
+            tz = None
+
+        if tz is None:
+            moment = moment.astimezone(timezone.utc) - SYNC_TZ_MARGIN
+        else:
+            moment = moment.astimezone(tz)
+        return moment.strftime("%Y/%m/%d %H:%M")
+
+    def sync_project(
+        self,
+        project_key: str,
+        output_dir: str = "jira_issues",
+        fields: str = DEFAULT_SEARCH_FIELDS,
+        expand: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Sincronizar incrementalmente un proyecto usando el campo 'updated'
+
+        La primera ejecución descarga el proyecto completo; las siguientes solo
+        los issues con updated >= marca guardada junto a los issues del proyecto.
+        La consulta se acota con updated <= inicio de la ejecución, que pasa a
+        ser la nueva marca: lo editado durante la sincronización queda para la
+        siguiente. Un issue editado sale del rango y corre hacia atrás a los
+        siguientes; al detectar que el total bajó se retrocede el desplazamiento
+        para no saltar ninguno. La marca se actualiza únicamente cuando la
+        sincronización termina y todos los issues se guardaron.
+
+        Args:
+            project_key: Clave del proyecto (ej: BT115)
+            output_dir: Carpeta base, igual que en save_issue (<output_dir>/<PROYECTO>)
+            fields: Campos a solicitar en la búsqueda
+            expand: Expansiones opcionales (ej: "renderedFields,names")
+
+        Yields:
+            Issues nuevos o modificados, ya guardados en disco
+        """
+        state_dir = os.path.join(output_dir, project_key)
+        mark = self.load_sync_mark(state_dir)
+
+        # JQL trabaja con minutos: la nueva marca se redondea hacia abajo para
+        # que este límite superior y el inferior de la próxima ejecución coincidan
+        bound = (datetime.now(timezone.utc) - SYNC_CLOCK_SKEW).replace(second=0, microsecond=0)
+        new_mark = bound.strftime(JIRA_TIMESTAMP_FORMAT)
+        clauses = [f"project = {project_key}", f'updated <= "{self._jql_timestamp(new_mark)}"']
+        if mark:
+            clauses.append(f'updated >= "{self._jql_timestamp(mark)}"')
+            logger.info("Sincronización incremental de %s desde %s", project_key, mark)
+        else:
+            logger.info("Sin marca previa para %s: sincronización completa", project_key)
+        jql = " AND ".join(clauses) + " ORDER BY updated ASC, key ASC"
+
+        start_at = 0
+        total = None
+        seen = set()
+        failed = 0
+        while True:
+            page = self._search_page(jql, fields, expand, start_at, 100)
+            page_total = page.get("total", 0)
+            if total is not None and page_total < total:
+                # Issues editados salieron del rango y los siguientes se corrieron
+                start_at = max(0, start_at - (total - page_total))
+                logger.info("Resultados de %s cambiaron durante la sincronización: retrocediendo a %d", project_key, start_at)
+                total = page_total
+                continue
+            total = page_total
+
+            issues = page.get("issues", [])
+            for issue in issues:
+                if issue.get("key") in seen:
+                    continue
+                seen.add(issue.get("key"))
+                if not self.save_issue(issue, output_dir):
+                    failed += 1
+                yield issue
+
+            start_at += len(issues)
+            if not issues or start_at >= total:
+                break
+
+        if failed:
+            logger.warning("Marca de sincronización de %s sin cambios: %d issues no se guardaron", project_key, failed)
+            return
+        self.save_sync_mark(state_dir, project_key, new_mark)
+        logger.info("Marca de sincronización de %s actualizada: %s", project_key, new_mark)
+
+    def save_issue(self, issue: Dict, output_dir: str = "jira_issues") -> bool:
+        """Guardar un issue en <output_dir>/<PROYECTO>/<clave>.json; devuelve False si falla"""
         try:
             issue_key = issue.get("key", "unknown_issue")
             safe_project_key = issue_key.split('-')[0]
@@ -169,21 +494,24 @@ class JiraExtractor:
             
             file_path = Path(final_output_dir) / f"{issue_key}.json"
             
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(issue, f, indent=2, ensure_ascii=False)
+            with METRICS.timer("json save_issue", issue_key):
+                with open(file_path, "w", encoding="utf-8") as f:
+                    json.dump(issue, f, indent=2, ensure_ascii=False)
                 
             logger.info(
                 "Issue guardado | Ruta: %s | Tamaño: %.2f KB",
                 file_path,
                 os.path.getsize(file_path)/1024
             )
+            return True
             
-        except json.JSONEncodeError as e:
+        except (TypeError, ValueError) as e:
             logger.error("Error serializando issue %s: %s", issue_key, str(e))
         except OSError as e:
             logger.error("Error de escritura en %s: %s", file_path, str(e))
         except Exception as e:
             logger.exception("Error crítico guardando issue %s: %s", issue_key, str(e))
+        return False
 
 def main():
     """Función CLI mantenida para compatibilidad"""
@@ -192,8 +520,7 @@ def main():
     print("="*40 + "\n")
     
     try:
-        config = configparser.ConfigParser()
-        config.read('secrets/secrets.ini', encoding='utf-8')
+        config = load_config()
         
         extractor = JiraExtractor(
             config.get('JIRA', 'URL'),
@@ -210,6 +537,7 @@ def main():
         print("\n" + "-"*40)
         print("1. Extraer issue específico")
         print("2. Extraer todos los issues")
+        print("3. Sincronizar cambios desde la última ejecución")
         print("-"*40)
         option = input("▶ Seleccione una opción: ").strip()
         
@@ -227,20 +555,31 @@ def main():
                 
         elif option == "2":
             print(f"\n🔄 Buscando todos los issues de {project_key}...")
-            if issues := extractor.get_all_issues(project_key):
-                print(f"\n🔍 Encontrados {len(issues)} issues")
-                print("⏳ Guardando... (esto puede tomar tiempo)")
-                
-                for i, issue_id in enumerate(issues, 1):
-                    issue = extractor.get_issue(issue_id)
-                    extractor.save_issue(issue)
-                    print(f"   [{i}/{len(issues)}] {issue_id}")
+            print("⏳ Guardando... (esto puede tomar tiempo)")
+            
+            journal = CheckpointJournal.for_run("jira", project_key)
+            saved = extractor.export_project(
+                project_key,
+                journal=journal,
+                progress=lambda position, total, key: print(f"   [{position}/{total}] {key}")
+            )
                     
+            if saved:
                 print(f"\n✅ Todos los issues guardados en:")
                 print(f"   {os.path.abspath('jira_issues')}")
             else:
                 print("\n❌ No se encontraron issues")
                 
+        elif option == "3":
+            print(f"\n🔄 Sincronizando cambios de {project_key}...")
+            synced = 0
+            for issue in extractor.sync_project(project_key):
+                synced += 1
+                print(f"   [{synced}] {issue.get('key')}")
+                
+            print(f"\n✅ {synced} issues nuevos o modificados guardados en:")
+            print(f"   {os.path.abspath(os.path.join('jira_issues', project_key))}")
+                
         else:
             print("\n⚠ Opción no válida")
             
@@ -0,0 +1,163 @@
+"""
+Copyright (c) 2025 Alejandro Ramírez
+Bajo la Licencia de Autor Restringida (LAR) v1.0
+Más detalles en LICENSE
+"""
+
+import os
+import re
+import time
+import heapq
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Segmentos variables de una URL que se agrupan en un mismo endpoint
+_ISSUE_KEY_SEGMENT_RE = re.compile(r"/[A-Za-z][A-Za-z0-9_]*-\d+(?=/|$)")
+# La versión de la API (/rest/api/3) se conserva
+_NUMERIC_SEGMENT_RE = re.compile(r"(?<!/api)/\d+(?=/|$)")
+
+def endpoint_name(method: str, url: str) -> str:
+    """Nombre estable de un endpoint: 'GET /rest/api/3/issue/{key}'"""
+    path = _ISSUE_KEY_SEGMENT_RE.sub("/{key}", urlsplit(url).path)
+    return f"{method} {_NUMERIC_SEGMENT_RE.sub('/{id}', path)}"
+
+class _Stage:
+    __slots__ = ("count", "total", "max", "slowest")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.slowest = []
+
+class Metrics:
+    """
+    Tiempos y contadores por etapa, seguros entre hilos
+
+    Cada medición suma una duración a su etapa (ej: 'http GET /tests',
+    'json save_issue') y conserva los elementos más lentos. El costo es
+    un perf_counter y un lock por medición, así que puede quedar activo.
+    Las conversiones en el pool de procesos no se agregan aquí: cada
+    proceso tiene su propia instancia.
+    """
+
+    def __init__(self, slowest: int = 5):
+        self.slowest = slowest
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages: Dict[str, _Stage] = {}
+            self._counters: Dict[str, int] = {}
+            self._started = time.perf_counter()
+
+    def record(self, stage: str, seconds: float, item: Optional[str] = None) -> None:
+        with self._lock:
+            entry = self._stages.get(stage)
+            if entry is None:
+                entry = self._stages[stage] = _Stage()
+            entry.count += 1
+            entry.total += seconds
+            if seconds > entry.max:
+                entry.max = seconds
+            if item is not None and self.slowest:
+                if len(entry.slowest) < self.slowest:
+                    heapq.heappush(entry.slowest, (seconds, item))
+                elif seconds > entry.slowest[0][0]:
+                    heapq.heapreplace(entry.slowest, (seconds, item))
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + amount
+
+    @contextmanager
+    def timer(self, stage: str, item: Optional[str] = None) -> Iterator[None]:
+        """Medir el bloque como una ejecución de 'stage'"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start, item)
+
+    def summary(self) -> Dict[str, Any]:
+        """Totales, rendimiento y elementos más lentos desde el último reset()"""
+        with self._lock:
+            wall = time.perf_counter() - self._started
+            stages = {
+                name: {
+                    "count": entry.count,
+                    "total_s": round(entry.total, 4),
+                    "mean_ms": round(entry.total / entry.count * 1000, 3),
+                    "max_ms": round(entry.max * 1000, 3),
+                    "per_s": round(entry.count / wall, 2) if wall else None,
+                    "slowest": [
+                        {"item": item, "ms": round(seconds * 1000, 3)}
+                        for seconds, item in sorted(entry.slowest, reverse=True)
+                    ]
+                }
+                for name, entry in self._stages.items()
+            }
+            return {"wall_s": round(wall, 3), "stages": stages, "counters": dict(self._counters)}
+
+    def log_summary(self, title: str = "Resumen de la ejecución") -> Dict[str, Any]:
+        """Registrar el resumen ordenado por tiempo total y devolverlo"""
+        summary = self.summary()
+        lines = [f"{title} | Tiempo total: {summary['wall_s']:.2f}s"]
+        ranked = sorted(summary["stages"].items(), key=lambda pair: pair[1]["total_s"], reverse=True)
+        for name, stage in ranked:
+            slowest = stage["slowest"][0] if stage["slowest"] else None
+            lines.append(
+                f"  {name}: {stage['count']} en {stage['total_s']:.2f}s | "
+                f"media {stage['mean_ms']:.1f} ms | máx {stage['max_ms']:.1f} ms | "
+                f"{stage['per_s']}/s"
+                + (f" | más lento: {slowest['item']}" if slowest else "")
+            )
+        for name, value in sorted(summary["counters"].items()):
+            lines.append(f"  {name}: {value}")
+        logger.info("\n".join(lines))
+        return summary
+
+# Instancia compartida por extractores, transporte y conversor
+METRICS = Metrics()
+
+@contextmanager
+def profiled(name: str, output_dir: Optional[str] = None, top: int = 25) -> Iterator[None]:
+    """
+    Perfilar el bloque con cProfile si se indica output_dir
+
+    Guarda <output_dir>/<name>_<fecha>.prof (para snakeviz o pstats) y
+    registra las funciones con mayor tiempo acumulado. Solo se perfila el
+    hilo que entra en el bloque; los hilos de descarga quedan cubiertos
+    por las métricas por endpoint.
+    """
+    if not output_dir:
+        yield
+        return
+
+    # Solo se cargan si el perfil está activo
+    import io
+    import pstats
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            path = os.path.join(output_dir, f"{name}_{datetime.now():%Y%m%d_%H%M%S}.prof")
+            profiler.dump_stats(path)
+            report = io.StringIO()
+            pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(top)
+            logger.info("Perfil guardado en %s\n%s", path, report.getvalue())
+        except OSError as e:
+            logger.warning("No se pudo guardar el perfil de %s: %s", name, str(e))
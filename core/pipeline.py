@@ -0,0 +1,165 @@
+"""
+Copyright (c) 2025 Alejandro Ramírez
+Bajo la Licencia de Autor Restringida (LAR) v1.0
+Más detalles en LICENSE
+"""
+
+import os
+import queue
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+def ve_source_name(test_case: Dict) -> str:
+    """Nombre del JSON que save_test_case daría a un caso de ValueEdge"""
+    return f"{test_case['Titulo']}.json"
+
+def jira_source_name(issue: Dict) -> str:
+    """Nombre del JSON que save_issue daría a un issue de JIRA"""
+    return f"{issue['key']}.json"
+
+class FeaturePipeline:
+    """
+    Conversión en streaming de registros extraídos a archivos .feature
+
+    Cada registro entregado con submit() se convierte en memoria y su .feature
+    se escribe en el momento, sin releer el JSON desde disco. La persistencia
+    JSON es opcional y corre en un hilo aparte alimentado por una cola acotada,
+    de modo que escribir el JSON no retrasa la conversión. submit() puede
+    pasarse directamente como 'sink' a los extractores: su 'on_saved' se
+    invoca recién cuando el .feature se generó y el JSON está en disco, que es
+    cuando el extractor puede marcar el registro en su journal. Sin conversor
+    solo se guardan los JSON (ej: salida agrupada por módulo, que se arma al
+    final). Con input_dir, al cerrar se registran en el manifiesto incremental del
+    conversor los .feature cuyo JSON quedó guardado en esa carpeta.
+    """
+
+    _DONE = object()
+
+    def __init__(
+        self,
+        converter: Optional[Any],
+        source_name: Callable[[Dict], str],
+        persist: Optional[Callable[[Dict], Optional[bool]]] = None,
+        queue_size: int = 256,
+        input_dir: Optional[str] = None
+    ):
+        """
+        Args:
+            converter: UltimateGherkinConverter con output_dir y prefijo ya fijados,
+                o None para solo guardar
+            source_name: Nombre del JSON de origen de cada registro
+            persist: Guardado JSON opcional (ej: save_test_case con su carpeta);
+                si lanza una excepción o devuelve False, el registro no se confirma
+            queue_size: Registros pendientes de guardar antes de bloquear submit()
+            input_dir: Carpeta donde persist guarda los JSON; con ella los
+                .feature generados se registran en el manifiesto del conversor
+        """
+        self.converter = converter
+        self.source_name = source_name
+        self.persist = persist
+        self.input_dir = input_dir
+        self.summary = {"generados": 0, "guardados": 0, "errores": []}
+        self._queue = None
+        self._writer = None
+        # {nombre del JSON: .feature} de los registros convertidos y guardados
+        self._streamed: Dict[str, str] = {}
+
+        if converter is not None:
+            os.makedirs(converter.output_dir, exist_ok=True)
+
+        if persist:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._writer = threading.Thread(
+                target=self._persist_loop, name="pipeline-json", daemon=True
+            )
+            self._writer.start()
+
+    def _persist_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._DONE:
+                break
+            record, output_file, on_saved = item
+            try:
+                saved = self.persist(record)
+            except Exception as e:
+                logger.error("Error guardando JSON de %s: %s", self.source_name(record), str(e))
+                continue
+            if saved is False:
+                # El guardado ya registró su error; sin confirmación el registro
+                # no se marca en el journal y se repite al reanudar
+                continue
+            self.summary["guardados"] += 1
+            if output_file is not None:
+                self._streamed[self.source_name(record)] = output_file
+            self._confirm(record, on_saved)
+
+    def _confirm(self, record: Dict, on_saved: Optional[Callable[[], None]]) -> None:
+        if on_saved is None:
+            return
+        try:
+            on_saved()
+        except Exception as e:
+            logger.error("Error confirmando guardado de %s: %s", self.source_name(record), str(e))
+
+    def submit(self, record: Dict, on_saved: Optional[Callable[[], None]] = None) -> Optional[str]:
+        """
+        Convertir un registro y encolar su guardado JSON; devuelve la ruta del .feature
+
+        Args:
+            record: Registro extraído
+            on_saved: Callback opcional tras convertir el registro y guardar su
+                JSON; no se invoca si alguno de los dos falla
+        """
+        output_file = None
+        if self.converter is not None:
+            try:
+                name = self.source_name(record)
+                output_file = self.converter.convert_record(record, name)
+                self.summary["generados"] += 1
+            except Exception as e:
+                logger.error("Error convirtiendo registro en streaming: %s", str(e))
+                self.summary["errores"].append(str(e))
+                # El JSON se guarda igual, pero sin confirmar: se reintenta al reanudar
+                on_saved = None
+
+        if self._queue is not None:
+            self._queue.put((record, output_file, on_saved))
+        elif output_file is not None:
+            self._confirm(record, on_saved)
+        return output_file
+
+    def run(self, records: Iterable[Dict]) -> Dict[str, Any]:
+        """Consumir un generador de registros completo y cerrar el pipeline"""
+        with self:
+            for record in records:
+                self.submit(record)
+        return self.summary
+
+    def close(self) -> Dict[str, Any]:
+        """Esperar a que terminen los guardados JSON pendientes"""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(self._DONE)
+            self._writer.join()
+
+        if self._streamed and self.input_dir and self.converter is not None:
+            try:
+                self.converter.record_conversions(self.input_dir, self._streamed)
+            except (OSError, ValueError) as e:
+                logger.error("No se pudo actualizar el manifiesto de conversión: %s", str(e))
+            self._streamed = {}
+
+        logger.info(
+            "Pipeline completado | Features: %d | JSON guardados: %d | Errores: %d",
+            self.summary["generados"], self.summary["guardados"], len(self.summary["errores"])
+        )
+        return self.summary
+
+    def __enter__(self) -> "FeaturePipeline":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
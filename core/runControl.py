@@ -0,0 +1,51 @@
+"""
+Copyright (c) 2025 Alejandro Ramírez
+Bajo la Licencia de Autor Restringida (LAR) v1.0
+Más detalles en LICENSE
+"""
+
+import threading
+
+class RunCancelled(Exception):
+    """La ejecución se canceló a pedido del usuario"""
+
+class RunControl:
+    """
+    Pausa y cancelación de una ejecución en otro hilo
+
+    La GUI llama a pause(), resume() o cancel(); los extractores llaman a
+    checkpoint() entre elementos, que se bloquea mientras la ejecución esté
+    en pausa y lanza RunCancelled si se canceló. Así el trabajo se detiene
+    en un punto limpio: el journal y la marca de sincronización quedan
+    consistentes para reanudar después.
+    """
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._running.is_set()
+
+    def pause(self) -> None:
+        self._running.clear()
+
+    def resume(self) -> None:
+        self._running.set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        # Despertar a los hilos en pausa para que vean la cancelación
+        self._running.set()
+
+    def checkpoint(self) -> None:
+        """Esperar mientras esté en pausa; lanzar RunCancelled si se canceló"""
+        self._running.wait()
+        if self._cancelled.is_set():
+            raise RunCancelled()
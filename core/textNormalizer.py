@@ -0,0 +1,63 @@
+"""
+Copyright (c) 2025 Alejandro Ramírez
+Bajo la Licencia de Autor Restringida (LAR) v1.0
+Más detalles en LICENSE
+"""
+
+import re
+import unicodedata
+
+# Caracteres de las líneas del script de ValueEdge: acentos que se
+# simplifican y viñetas/iconos que se eliminan
+_SCRIPT_REPLACEMENTS = (
+    ('ú', 'u'), ('ó', 'o'), ('í', 'i'), ('é', 'e'), ('É', 'E'),
+    ('⚪', ''), ('⦿', ''), ('⦾', ''), ('●', ''), ('✅', ''), ('❌', '')
+)
+_SCRIPT_CHARS_RE = re.compile('[' + ''.join(old for old, _ in _SCRIPT_REPLACEMENTS) + ']')
+
+# Expresiones de limpieza compiladas al importar el módulo
+_STEP_INVALID_RE = re.compile(r'[^\wá-úÁ-Ú \n\-]', re.IGNORECASE)
+_FILENAME_INVALID_RE = re.compile(r'[^\w\s-]')
+_FILENAME_SPACES_RE = re.compile(r'[\s-]+')
+_FILENAME_UNDERSCORES_RE = re.compile(r'[._]+')
+
+def clean_script_line(text: str) -> str:
+    """
+    Limpiar una línea del script de un caso de ValueEdge
+
+    La mayoría de las líneas no tiene ningún carácter a reemplazar: una sola
+    búsqueda lo descarta antes de recorrer los reemplazos. str.translate se
+    midió más lento que str.replace para este texto no ASCII.
+    """
+    if _SCRIPT_CHARS_RE.search(text) is None:
+        return text.strip()
+    for old, new in _SCRIPT_REPLACEMENTS:
+        text = text.replace(old, new)
+    return text.strip()
+
+def clean_step_text(text: str) -> str:
+    """Quitar de un paso los caracteres que no admite un step de Gherkin"""
+    return _STEP_INVALID_RE.sub('', text).strip()
+
+def normalize_filename(filename: str) -> str:
+    """Nombre de .feature ASCII, sin símbolos y con '_' como separador"""
+    name = filename.rsplit('.json', 1)[0]
+    normalized = unicodedata.normalize('NFKD', name)
+    ascii_name = normalized.encode('ASCII', 'ignore').decode('utf-8')
+    cleaned = _FILENAME_INVALID_RE.sub('', ascii_name)
+    underscored = _FILENAME_SPACES_RE.sub('_', cleaned)
+    final_name = _FILENAME_UNDERSCORES_RE.sub('_', underscored).strip('_')
+    return f"{final_name}.feature"
+
+class StepTextCache(dict):
+    """
+    Textos limpios de un registro, calculados la primera vez que se piden
+
+    Un mismo paso se consulta al detectar patrones, al elegir el Given y al
+    buscar la última validación; con una instancia por registro cada texto
+    se limpia una sola vez y la memoria se libera al terminar el registro.
+    """
+
+    def __missing__(self, text: str) -> str:
+        cleaned = self[text] = clean_step_text(text)
+        return cleaned
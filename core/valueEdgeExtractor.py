@@ -5,40 +5,51 @@ Más detalles en LICENSE
 """ 
 
 import json
+import time
+import threading
 import requests
 import logging
 import urllib3
-import configparser
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from functools import partial
 from pathlib import Path
-from typing import Dict, Optional
-import tkinter as tk
-from tkinter import messagebox, simpledialog
-import sys
-import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sized, Tuple
+
+try:
+    from core.checkpoint import CheckpointJournal, PageTracker
+    from core.config import default_config_path, load_config
+    from core.httpTransport import HttpTransport
+    from core.textNormalizer import clean_script_line
+    from core.metrics import METRICS
+    from core.runControl import RunControl
+except ImportError:  # Ejecución directa desde core/
+    from checkpoint import CheckpointJournal, PageTracker
+    from config import default_config_path, load_config
+    from httpTransport import HttpTransport
+    from textNormalizer import clean_script_line
+    from metrics import METRICS
+    from runControl import RunControl
 
 # Suprimir advertencias de SSL
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Espera base (segundos) entre reintentos de un caso; se duplica en cada intento
+RETRY_DELAY = 1.0
+# IDs por consulta al pedir nombre y módulo de varios tests a la vez
+METADATA_CHUNK_SIZE = 100
+# Tests por página al listar el workspace
+TESTS_PAGE_SIZE = 1000
+
 class ValueEdgeExtractor:
-    def __init__(self, config_path: str = None):
-        # Determinar si el código está empaquetado
-        if getattr(sys, 'frozen', False):
-            base_dir = sys._MEIPASS
-        else:
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
-        # Ruta absoluta del archivo de configuración
-        config_path = os.path.join(base_dir, 'secrets', 'secrets.ini')
-        
-        self.config = configparser.ConfigParser()
-        self.config.read(config_path, encoding='utf-8')
+    def __init__(self, config_path: str = None, transport: Optional[HttpTransport] = None):
+        config_path = config_path or default_config_path()
+        # Configuración compartida: no se vuelve a leer si la aplicación ya la cargó
+        self.config = load_config(config_path)
         
         # Verificar sección crítica
         if not self.config.has_section('ValueEdge'):
             raise ValueError(f"Sección [ValueEdge] no encontrada en {config_path}")
-        # Leer secrets
-        config = configparser.ConfigParser()
-        config.read(config_path, encoding='utf-8')
+        config = self.config
         
         # Obtener valores de secrets
         self.url = config.get('ValueEdge', 'URL').rstrip('/')
@@ -49,9 +60,9 @@ class ValueEdgeExtractor:
         self.password = config.get('ValueEdge', 'PASSWORD')
         self.login_url = config.get('ValueEdge', 'LOGIN')
         
-        # Inicializar sesión
-        self.session = requests.Session()
-        self.session.verify = False
+        # Inicializar sesión sobre el transporte HTTP compartido
+        self.transport = transport or HttpTransport(verify=False)
+        self.session = self.transport.session
         
         # Configurar logging
         logging.basicConfig(
@@ -65,6 +76,9 @@ class ValueEdgeExtractor:
             "ALM_OCTANE_TECH_PREVIEW": self.tech_preview_flag
         }
         self.cookies = None
+        # Renovación de sesión compartida entre workers
+        self._login_lock = threading.Lock()
+        self._session_generation = 0
 
     def login(self) -> bool:
         """Realizar login en Value Edge"""
@@ -75,7 +89,7 @@ class ValueEdgeExtractor:
             }
             
             self.logger.info("Intentando login en Value Edge...")
-            response = self.session.post(
+            response = self.transport.post(
                 self.url + '/authentication/sign_in',
                 headers=self.headers,
                 json=data
@@ -92,6 +106,7 @@ class ValueEdgeExtractor:
                     }
                     # Actualizar la sesión con las cookies
                     self.session.cookies.update(self.cookies)
+                    self._session_generation += 1
                     self.logger.info("Login exitoso")
                     return True
                 else:
@@ -106,12 +121,111 @@ class ValueEdgeExtractor:
             self.logger.error(f"Error durante login: {str(e)}")
             return False
 
-    def get_test_case(self, test_id: str) -> Optional[Dict]:
+    def _renew_session(self, generation: int) -> bool:
+        """
+        Repetir el login tras un 401, una sola vez aunque fallen varios workers
+        
+        Args:
+            generation: Generación de sesión con la que se envió la solicitud rechazada
+        """
+        with self._login_lock:
+            if self._session_generation != generation:
+                # Otro worker ya renovó la sesión mientras esperábamos
+                return True
+            self.logger.warning("Sesión de ValueEdge expirada. Renovando login...")
+            return self.login()
+
+    def _get(self, url: str, **kwargs):
+        """
+        GET autenticado que renueva la sesión y reintenta una vez ante un 401
+        
+        Acepta cache=True para pasar por la caché de respuestas del transporte.
+        """
+        generation = self._session_generation
+        response = self.transport.get(url, headers=self.headers, **kwargs)
+        if response.status_code == 401 and self._renew_session(generation):
+            response = self.transport.get(url, headers=self.headers, **kwargs)
+        return response
+
+    def _get_test_info(self, test_id: str) -> Optional[Dict]:
+        """Obtener título y módulo de un único test"""
+        title_url = f"{self.url}/api/shared_spaces/{self.shared_space}/workspaces/{self.workspace}/tests"
+        params = {
+            'query': f'"id EQ \'{test_id}\'"',
+            'fields': 'name,application_modules'
+        }
+        
+        title_response = self._get(
+            title_url,
+            params=params,
+            cache=True
+        )
+        
+        self.logger.info(f"Respuesta de título: {title_response.status_code}")
+        
+        if title_response.status_code != 200:
+            self.logger.error(f"Error obteniendo detalles del test: {title_response.status_code}")
+            self.logger.error(f"Respuesta: {title_response.text}")
+            return None
+            
+        title_data = title_response.json()
+        if not title_data.get('data'):
+            self.logger.error("No se encontró el caso de prueba")
+            return None
+            
+        return title_data['data'][0]
+
+    def get_tests_metadata(self, test_ids: List[str], chunk_size: int = METADATA_CHUNK_SIZE) -> Optional[Dict[str, Dict]]:
+        """
+        Obtener nombre y módulos de varios tests con una consulta por bloque
+        
+        Args:
+            test_ids: IDs de los casos de prueba
+            chunk_size: Máximo de IDs por consulta (id IN ...)
+            
+        Returns:
+            Diccionario {id: datos del test} o None si alguna consulta falla
+        """
+        if not self.cookies:
+            self.logger.error("No hay sesión activa. Ejecute login() primero")
+            return None
+
+        metadata = {}
+        try:
+            tests_url = f"{self.url}/api/shared_spaces/{self.shared_space}/workspaces/{self.workspace}/tests"
+            for start in range(0, len(test_ids), chunk_size):
+                chunk = test_ids[start:start + chunk_size]
+                ids = ",".join(f"'{test_id}'" for test_id in chunk)
+                params = {
+                    'query': f'"id IN {ids}"',
+                    'fields': 'name,application_modules',
+                    'limit': len(chunk)
+                }
+                
+                response = self._get(tests_url, params=params, cache=True)
+                if response.status_code != 200:
+                    self.logger.error(f"Error obteniendo metadatos de tests: {response.status_code}")
+                    self.logger.error(f"Respuesta: {response.text}")
+                    return None
+                    
+                for test in response.json().get('data', []):
+                    metadata[str(test['id'])] = test
+                    
+            self.logger.info(f"Metadatos obtenidos para {len(metadata)}/{len(test_ids)} tests")
+            return metadata
+            
+        except Exception as e:
+            self.logger.error(f"Error obteniendo metadatos de tests: {str(e)}")
+            return None
+
+    def get_test_case(self, test_id: str, test_info: Optional[Dict] = None) -> Optional[Dict]:
         """
         Obtener caso de prueba específico
         
         Args:
             test_id: ID del caso de prueba
+            test_info: Nombre y módulos ya obtenidos (get_tests_metadata); si se
+                indica, solo se descarga el script
         """
         if not self.cookies:
             self.logger.error("No hay sesión activa. Ejecute login() primero")
@@ -121,36 +235,14 @@ class ValueEdgeExtractor:
             # Obtener detalles del test
             self.logger.info(f"Obteniendo caso de prueba {test_id}...")
             
-            # Obtener título y módulo
-            title_url = f"{self.url}/api/shared_spaces/{self.shared_space}/workspaces/{self.workspace}/tests"
-            params = {
-                'query': f'"id EQ \'{test_id}\'"',
-                'fields': 'name,application_modules'
-            }
-            
-            title_response = self.session.get(
-                title_url,
-                params=params,
-                headers=self.headers
-            )
-            
-            self.logger.info(f"Respuesta de título: {title_response.status_code}")
-            
-            if title_response.status_code != 200:
-                self.logger.error(f"Error obteniendo detalles del test: {title_response.status_code}")
-                self.logger.error(f"Respuesta: {title_response.text}")
-                return None
-                
-            title_data = title_response.json()
-            if not title_data.get('data'):
-                self.logger.error("No se encontró el caso de prueba")
-                return None
-                
-            test_info = title_data['data'][0]
+            if test_info is None:
+                test_info = self._get_test_info(test_id)
+                if test_info is None:
+                    return None
             
             # Obtener pasos del test
             steps_url = f"{self.url}/api/shared_spaces/{self.shared_space}/workspaces/{self.workspace}/tests/{test_id}/script"
-            steps_response = self.session.get(steps_url, headers=self.headers)
+            steps_response = self._get(steps_url, cache=True)
             
             self.logger.info(f"Respuesta de pasos: {steps_response.status_code}")
             
@@ -171,7 +263,7 @@ class ValueEdgeExtractor:
             current_step = 1
             
             for line in script:
-                line = self._clean_text(line)
+                line = clean_script_line(line)
                 if not line:
                     continue
                     
@@ -193,75 +285,342 @@ class ValueEdgeExtractor:
             self.logger.error(f"Error procesando caso de prueba: {str(e)}")
             return None
             
+    def iter_test_id_pages(
+        self,
+        page_size: int = TESTS_PAGE_SIZE,
+        start_offset: int = 0
+    ) -> Iterator[Tuple[List[str], int]]:
+        """
+        Recorrer la lista de tests del workspace página a página
+        
+        Args:
+            page_size: Tests por página (offset/limit)
+            start_offset: Posición desde la que empezar (para reanudar)
+            
+        Yields:
+            Tuplas (IDs de la página, total_count reportado por ValueEdge)
+            
+        Raises:
+            requests.exceptions.HTTPError: Si ValueEdge responde con un código distinto de 200
+        """
+        tests_url = f"{self.url}/api/shared_spaces/{self.shared_space}/workspaces/{self.workspace}/tests"
+        offset = start_offset
+        seen = start_offset
+        total_count = None
+        
+        self.logger.info("Obteniendo lista de casos de prueba...")
+        while True:
+            params = {
+                'fields': 'id',
+                'order_by': 'id',
+                'offset': offset,
+                'limit': page_size
+            }
+            response = self._get(
+                tests_url,
+                params=params
+            )
+            
+            if response.status_code != 200:
+                self.logger.error(f"Error obteniendo lista de tests: {response.status_code}")
+                raise requests.exceptions.HTTPError(
+                    f"Respuesta inesperada de ValueEdge: {response.status_code}",
+                    response=response
+                )
+                
+            tests_data = response.json()
+            page = [test['id'] for test in tests_data.get('data', [])]
+            if total_count is None:
+                total_count = tests_data.get('total_count', len(page))
+                self.logger.info(f"Se encontraron {total_count} casos de prueba")
+                
+            if not page:
+                break
+                
+            seen += len(page)
+            yield page, total_count
+            
+            offset += len(page)
+            if offset >= total_count:
+                break
+                
+        if seen != total_count:
+            self.logger.warning(
+                f"Se recibieron {seen} casos de prueba pero ValueEdge reporta {total_count}"
+            )
+
     def get_all_test_cases(self) -> Optional[list]:
-            """
-            Obtener todos los casos de prueba disponibles
-            
-            Returns:
-                Lista de IDs de casos de prueba o None si hay error
-            """
-            if not self.cookies:
-                self.logger.error("No hay sesión activa. Ejecute login() primero")
-                return None
+        """
+        Obtener todos los casos de prueba disponibles
+        
+        Returns:
+            Lista de IDs de casos de prueba o None si hay error
+        """
+        if not self.cookies:
+            self.logger.error("No hay sesión activa. Ejecute login() primero")
+            return None
+
+        try:
+            test_ids = [test_id for page, _ in self.iter_test_id_pages() for test_id in page]
+            if not test_ids:
+                self.logger.info("No se encontraron casos de prueba")
+            return test_ids
+            
+        except Exception as e:
+            self.logger.error(f"Error obteniendo lista de casos de prueba: {str(e)}")
+            return None            
+
+    def iter_test_cases(
+        self,
+        test_ids: Iterable[str],
+        max_workers: int = 8,
+        retries: int = 2,
+        control: Optional[RunControl] = None
+    ) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """
+        Obtener varios casos de prueba en paralelo compartiendo la sesión activa
+
+        El nombre y el módulo se piden por bloques con get_tests_metadata, de
+        modo que cada worker solo descarga el script de su caso.
+
+        Args:
+            test_ids: IDs de los casos de prueba
+            max_workers: Número máximo de descargas simultáneas
+            retries: Reintentos por caso antes de darlo por fallido
+            control: Control de cancelación; un caso cancelado no se reintenta
+
+        Yields:
+            Tuplas (id, caso de prueba) en el orden en que terminan; el caso es None si falló
+        """
+        max_pending = max(1, max_workers) * 2
+
+        def fetch(test_id: str, test_info: Optional[Dict]) -> Optional[Dict]:
+            for attempt in range(retries + 1):
+                if control and control.cancelled:
+                    return None
+                test_case = self.get_test_case(test_id, test_info)
+                if test_case:
+                    return test_case
+                if attempt < retries:
+                    delay = RETRY_DELAY * (2 ** attempt)
+                    self.logger.warning(
+                        f"Reintentando caso {test_id} en {delay:.1f}s ({attempt + 1}/{retries})"
+                    )
+                    time.sleep(delay)
+            return None
+
+        def resolve(chunk: List[str]) -> Iterator[Tuple[str, Optional[Dict], bool]]:
+            metadata = self.get_tests_metadata(chunk)
+            for test_id in chunk:
+                if metadata is None:
+                    # Consulta en bloque fallida: cada worker pide sus propios metadatos
+                    yield test_id, None, True
+                elif test_id in metadata:
+                    yield test_id, metadata[test_id], True
+                else:
+                    self.logger.error(f"No se encontró el caso de prueba {test_id}")
+                    yield test_id, None, False
+
+        def with_metadata() -> Iterator[Tuple[str, Optional[Dict], bool]]:
+            # Un único query de nombre/módulo por bloque; los workers solo piden /script
+            chunk = []
+            for test_id in test_ids:
+                chunk.append(str(test_id))
+                if len(chunk) >= METADATA_CHUNK_SIZE:
+                    yield from resolve(chunk)
+                    chunk = []
+            if chunk:
+                yield from resolve(chunk)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            pending = {}
 
             try:
-                # Obtener lista de todos los tests
-                tests_url = f"{self.url}/api/shared_spaces/{self.shared_space}/workspaces/{self.workspace}/tests"
-                params = {
-                    'fields': 'id',
-                    'limit': 1000  # Ajustar según necesidad
-                }
-                
-                self.logger.info("Obteniendo lista de casos de prueba...")
-                response = self.session.get(
-                    tests_url,
-                    params=params,
-                    headers=self.headers
-                )
+                for test_id, test_info, found in with_metadata():
+                    if not found:
+                        yield test_id, None
+                        continue
+
+                    pending[executor.submit(fetch, test_id, test_info)] = test_id
+                    if len(pending) < max_pending:
+                        continue
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield pending.pop(future), future.result()
+
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield pending.pop(future), future.result()
+            finally:
+                # Si se cierra el generador antes de tiempo, las descargas en cola no empiezan
+                for future in pending:
+                    future.cancel()
+
+    def extract_test_cases(
+        self,
+        test_ids: Iterable[str],
+        output_dir: str = "test_cases",
+        max_workers: int = 8,
+        retries: int = 2,
+        progress: Optional[Callable[[int, int, str, bool], None]] = None,
+        total: Optional[int] = None,
+        journal: Optional[CheckpointJournal] = None,
+        sink: Optional[Callable[[Dict, Optional[Callable[[], None]]], None]] = None,
+        control: Optional[RunControl] = None
+    ) -> Dict[str, Any]:
+        """
+        Extraer y guardar un lote de casos de prueba en paralelo
+
+        Args:
+            test_ids: IDs de los casos de prueba (lista o generador)
+            output_dir: Carpeta destino de los JSON
+            max_workers: Número máximo de descargas simultáneas
+            retries: Reintentos por caso antes de darlo por fallido
+            progress: Callback opcional (procesados, total, id, éxito) por cada caso
+            total: Total esperado para el progreso cuando test_ids es un generador
+            journal: Journal de checkpoint (o PageTracker); se omiten los IDs ya
+                completados y se registran los nuevos éxitos una vez guardados
+            sink: Destino de cada caso en lugar de save_test_case, llamado como
+                sink(caso, on_saved); debe invocar on_saved() cuando el caso
+                esté guardado (ej: el submit() de un FeaturePipeline)
+            control: Pausa y cancelación entre casos; al cancelar se lanza
+                RunCancelled con el journal al día
+
+        Returns:
+            Resumen con 'exitosos', 'fallidos', 'total' e 'ids_fallidos'
+        """
+        if total is None and isinstance(test_ids, Sized):
+            total = len(test_ids)
+            
+        if not self.cookies:
+            self.logger.error("No hay sesión activa. Ejecute login() primero")
+            test_ids = list(test_ids)
+            return {"exitosos": 0, "fallidos": len(test_ids), "total": len(test_ids),
+                    "ids_fallidos": test_ids}
+
+        summary = {"exitosos": 0, "fallidos": 0, "total": 0, "ids_fallidos": []}
+        self.logger.info(f"Extracción paralela de {total or '?'} casos con {max_workers} hilos")
+
+        if journal:
+            test_ids = (test_id for test_id in test_ids if not journal.is_done(test_id))
+
+        results = self.iter_test_cases(
+            test_ids, max_workers=max_workers, retries=retries, control=control
+        )
+        for processed, (test_id, test_case) in enumerate(results, 1):
+            if control:
+                control.checkpoint()
+            ok = test_case is not None
+            if test_case:
+                on_saved = partial(journal.mark_done, test_id) if journal else None
+                if sink:
+                    sink(test_case, on_saved)
+                else:
+                    ok = self.save_test_case(test_case, output_dir)
+                    if ok and on_saved:
+                        on_saved()
+            if ok:
+                summary["exitosos"] += 1
+            else:
+                summary["fallidos"] += 1
+                summary["ids_fallidos"].append(test_id)
+            summary["total"] = processed
+
+            if progress:
+                progress(processed, max(total or 0, processed), test_id, ok)
+
+        self.logger.info(
+            f"Extracción completada: {summary['exitosos']} exitosos, {summary['fallidos']} fallidos"
+        )
+        return summary
+
+    def extract_all_test_cases(
+        self,
+        output_dir: str = "test_cases",
+        max_workers: int = 8,
+        retries: int = 2,
+        progress: Optional[Callable[[int, int, str, bool], None]] = None,
+        journal: Optional[CheckpointJournal] = None,
+        sink: Optional[Callable[[Dict, Optional[Callable[[], None]]], None]] = None,
+        control: Optional[RunControl] = None
+    ) -> Dict[str, Any]:
+        """
+        Extraer todo el workspace mientras se siguen paginando los IDs
+        
+        Las descargas de una página empiezan antes de pedir la siguiente, y en
+        memoria solo se conserva la página en curso. Con un journal, una
+        ejecución interrumpida se reanuda desde la primera página con casos
+        pendientes; al terminar el listado y la extracción el journal se elimina
+        aunque haya fallidos, que se informan en 'ids_fallidos' (un caso que
+        falla siempre no debe dejar las siguientes ejecuciones en modo reanudar).
+        
+        Args:
+            output_dir: Carpeta destino de los JSON
+            max_workers: Número máximo de descargas simultáneas
+            retries: Reintentos por caso antes de darlo por fallido
+            progress: Callback opcional (procesados, total, id, éxito) por cada caso
+            journal: Journal de checkpoint opcional (CheckpointJournal.for_run)
+            sink: Destino de cada caso en lugar de save_test_case
+            control: Pausa y cancelación entre casos (RunControl)
+            
+        Returns:
+            Resumen con 'exitosos', 'fallidos', 'total' e 'ids_fallidos'
+        """
+        total_count = [0]
+        start_offset = int(journal.cursor or 0) if journal else 0
+        # El cursor solo avanza sobre páginas con todos sus casos ya guardados
+        tracker = PageTracker(journal) if journal else None
+        
+        def stream_ids() -> Iterator[str]:
+            offset = start_offset
+            for page, total in self.iter_test_id_pages(start_offset=start_offset):
+                total_count[0] = total
+                pending = [str(test_id) for test_id in page if not (journal and journal.is_done(test_id))]
+                if tracker:
+                    tracker.open_page(offset, offset + len(page), pending)
+                offset += len(page)
+                yield from pending
                 
-                if response.status_code != 200:
-                    self.logger.error(f"Error obteniendo lista de tests: {response.status_code}")
-                    return None
-                    
-                tests_data = response.json()
-                if not tests_data.get('data'):
-                    self.logger.info("No se encontraron casos de prueba")
-                    return []
-                    
-                test_ids = [test['id'] for test in tests_data['data']]
-                self.logger.info(f"Se encontraron {len(test_ids)} casos de prueba")
-                return test_ids
+        def report(processed, _total, test_id, ok):
+            if progress:
+                progress(processed, max(total_count[0], processed), test_id, ok)
                 
-            except Exception as e:
-                self.logger.error(f"Error obteniendo lista de casos de prueba: {str(e)}")
-                return None            
+        try:
+            summary = self.extract_test_cases(
+                stream_ids(), output_dir, max_workers=max_workers, retries=retries,
+                progress=report, journal=tracker, sink=sink, control=control
+            )
+        except BaseException:
+            if journal:
+                journal.close()
+            raise
+            
+        if summary["fallidos"]:
+            self.logger.warning(f"Casos fallidos: {', '.join(map(str, summary['ids_fallidos']))}")
+        if journal:
+            journal.complete()
+        return summary
 
-    def save_test_case(self, test_case: Dict, output_dir: str = "test_cases") -> None:
-        """Guardar caso de prueba en archivo JSON"""
+    def save_test_case(self, test_case: Dict, output_dir: str = "test_cases") -> bool:
+        """Guardar caso de prueba en archivo JSON; devuelve False si falla"""
         try:
             # Crear directorio si no existe
             Path(output_dir).mkdir(parents=True, exist_ok=True)
             
             # Guardar archivo
             output_file = Path(output_dir) / f"{test_case['Titulo']}.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(test_case, f, indent=2, ensure_ascii=False)
+            with METRICS.timer("json save_test_case", test_case['Titulo']):
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(test_case, f, indent=2, ensure_ascii=False)
                 
             self.logger.info(f"Caso de prueba guardado en {output_file}")
+            return True
             
         except Exception as e:
             self.logger.error(f"Error guardando archivo: {str(e)}")
-
-    @staticmethod
-    def _clean_text(text: str) -> str:
-        """Limpiar texto de caracteres especiales"""
-        replacements = {
-            'ú': 'u', 'ó': 'o', 'í': 'i', 'é': 'e', 'É': 'E',
-            '⚪': '', '⦿': '', '⦾': '', '●': '', '✅': '', '❌': ''
-        }
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        return text.strip()
+            return False
 
 def center_window(window):
     """
@@ -279,9 +638,13 @@ def center_window(window):
 
 def main():
     """Función principal para ejecutar el extractor"""
+    # tkinter solo se necesita para los diálogos de esta CLI
+    import tkinter as tk
+    from tkinter import messagebox, simpledialog
+    
     try:
         # Crear instancia del extractor
-        extractor = ValueEdgeExtractor('secrets/secrets.ini')
+        extractor = ValueEdgeExtractor()
         
         # Realizar login
         if not extractor.login():
@@ -297,33 +660,24 @@ def main():
         center_window(root)  # Centrar la ventana de confirmación
 
         if opcion:
-            # Extraer todos los casos
-            test_ids = extractor.get_all_test_cases()
-            if not test_ids:
-                print("\nNo se encontraron casos de prueba para extraer")
-                return
-                
-            print(f"\nSe encontraron {len(test_ids)} casos de prueba")
-            print("Iniciando extracción...\n")
+            # Extraer todos los casos mientras se paginan los IDs
+            print("\nIniciando extracción...\n")
             
-            total = len(test_ids)
-            exitosos = 0
-            fallidos = 0
+            def report(processed, total, test_id, ok):
+                print(f"Procesado caso {processed}/{total} (ID: {test_id}){'' if ok else ' - FALLIDO'}")
             
-            for i, test_id in enumerate(test_ids, 1):
-                print(f"\nProcesando caso {i}/{total} (ID: {test_id})")
-                test_case = extractor.get_test_case(test_id)
-                
-                if test_case:
-                    extractor.save_test_case(test_case)
-                    exitosos += 1
-                else:
-                    fallidos += 1
+            journal = CheckpointJournal.for_run("ve", extractor.workspace)
+            summary = extractor.extract_all_test_cases(progress=report, journal=journal)
+            if not summary['total']:
+                print("\nNo se encontraron casos de prueba para extraer")
+                return
             
             print(f"\nExtracción completada:")
-            print(f"- Casos exitosos: {exitosos}")
-            print(f"- Casos fallidos: {fallidos}")
-            print(f"- Total procesados: {total}")
+            print(f"- Casos exitosos: {summary['exitosos']}")
+            print(f"- Casos fallidos: {summary['fallidos']}")
+            print(f"- Total procesados: {summary['total']}")
+            if summary['ids_fallidos']:
+                print(f"- IDs fallidos: {', '.join(map(str, summary['ids_fallidos']))}")
             
         else:
             # Pedir al usuario el ID del caso de prueba a extraer
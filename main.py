@@ -6,10 +6,18 @@ Más detalles en LICENSE
  
 import tkinter as tk
 from tkinter import messagebox, simpledialog
-from core.jiraExtractor import JiraExtractor
-from core.valueEdgeExtractor import ValueEdgeExtractor
-from core.gherkinConverter import UltimateGherkinConverter
+from typing import TYPE_CHECKING
+# Extractores, conversor, métricas y requests se importan al usar una fuente:
+# la ventana principal aparece sin esperarlos (ver benchmarks/bench_startup.py)
+from core.config import default_config_path, load_config, missing_keys
+from core.runControl import RunCancelled, RunControl
 import configparser
+import functools
+import json
+import multiprocessing
+import queue
+import threading
+import time
 import os
 import sys
 import logging
@@ -22,39 +30,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def check_config():
-    """Verificación avanzada del archivo de configuración"""
+if TYPE_CHECKING:
+    from core.gherkinConverter import UltimateGherkinConverter
+    from core.pipeline import FeaturePipeline
+
+def check_config(config_path: str) -> configparser.ConfigParser:
+    """Verificación avanzada del archivo de configuración; devuelve la configuración compartida"""
     try:
-        if getattr(sys, 'frozen', False):
-            base_dir = sys._MEIPASS
-        else:
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        config_path = os.path.join(base_dir, 'secrets', 'secrets.ini')
-        config = configparser.ConfigParser()
-        config.read(config_path, encoding='utf-8')
-        
-        required_sections = {
-            'ValueEdge': ['URL', 'USER', 'PASSWORD', 'SHARED_SPACE'],
-            'JIRA': ['URL', 'EMAIL', 'API_TOKEN']
-        }
-        
-        errors = []
-        for section, keys in required_sections.items():
-            if not config.has_section(section):
-                errors.append(f"❌ Falta sección: [{section}]")
-                continue
-                
-            for key in keys:
-                if not config.has_option(section, key):
-                    errors.append(f"❌ Falta clave: [{section}] {key}")
+        config = load_config(config_path)
         
+        errors = [f"❌ {error}" for error in missing_keys(config)]
         if errors:
             error_msg = "\n".join(errors)
             error_msg += f"\n\n🔍 Ruta del archivo: {config_path}"
             raise RuntimeError(error_msg)
             
-        return True
+        return config
         
     except Exception as e:
         messagebox.showerror("Error de Configuración", 
@@ -65,9 +56,69 @@ def check_config():
             "3. Todas las claves requeridas están presentes")
         sys.exit(1)
 
+def write_startup_probe(root: tk.Tk, path: str):
+    """Registrar cuándo la ventana principal ya es visible y cerrar la aplicación"""
+    root.wait_visibility()
+    root.update_idletasks()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"ready": time.time()}, f)
+    root.destroy()
+
+def instrumented_run(source):
+    """Medir una ejecución completa: métricas por etapa y perfil opcional"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, mode, *args, **kwargs):
+            from core.metrics import METRICS, profiled
+            name = f"{source}_{mode}"
+            METRICS.reset()
+            with profiled(name, self.profile_dir):
+                try:
+                    return method(self, mode, *args, **kwargs)
+                finally:
+                    summary = METRICS.log_summary(f"Resumen de {name}")
+                    self.save_run_summary(name, summary)
+        return wrapper
+    return decorator
+
+# Intervalo con el que la GUI lee el avance del hilo de trabajo
+PROGRESS_POLL_MS = 100
+
+class BackgroundRun:
+    """
+    Extracción ejecutada en un hilo de trabajo
+
+    El hilo nunca toca widgets de Tk: publica el avance y el resultado en una
+    cola que la GUI lee con root.after. El trabajo recibe 'control' para
+    pausa/cancelación y 'report' para el avance, y devuelve una tupla
+    (nivel, título, mensaje) para messagebox.
+    """
+
+    def __init__(self, name: str, job, *args):
+        self.control = RunControl()
+        self.events = queue.Queue()
+        self.thread = threading.Thread(target=self._run, args=(job, args), name=name, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def report(self, text: str):
+        self.events.put(("progreso", text))
+
+    def _run(self, job, args):
+        try:
+            result = job(*args, control=self.control, report=self.report)
+        except RunCancelled:
+            logger.info(f"Ejecución {self.thread.name} cancelada")
+            result = ("warning", "Cancelado", "Extracción cancelada\nLa próxima ejecución continúa donde quedó")
+        except Exception as e:
+            logger.error(f"Error en {self.thread.name}: {str(e)}")
+            result = ("error", "Error", f"Error crítico: {str(e)}")
+        self.events.put(("fin", result))
+
 class AutomationApp:
     def __init__(self):
-        check_config()
+        self.load_config()
         self.root = tk.Tk()
         self.root.title("DICAI v1.05")
         self.root.geometry("400x300")
@@ -75,30 +126,39 @@ class AutomationApp:
         self.current_workspace = None
         self.jira_extractor = None
         self.ve_extractor = None
-        self.load_config()
+        self.converter = None
+        # Ejecución en segundo plano en curso: (BackgroundRun, ventana, etiqueta)
+        self.active_run = None
+        # Salida opcional de un .feature por módulo en lugar de uno por caso
+        self.group_by_module = self.config.getboolean('Conversion', 'GROUP_BY_MODULE', fallback=False)
+        # Perfil cProfile y resumen JSON de cada ejecución, definidos en [Profiling]
+        self.profile_dir = (
+            self.config.get('Profiling', 'DIR', fallback=os.path.join("output", "profiles"))
+            if self.config.getboolean('Profiling', 'ENABLED', fallback=False) else None
+        )
         self.create_main_menu()
 
     def load_config(self):
-        """Cargar configuración con manejo de rutas empaquetadas"""
-        try:
-            if getattr(sys, 'frozen', False):
-                base_dir = sys._MEIPASS
-            else:
-                base_dir = os.path.dirname(os.path.abspath(__file__))
-            
-            config_path = os.path.join(base_dir, 'secrets', 'secrets.ini')
-            self.config = configparser.ConfigParser()
-            self.config.read(config_path, encoding='utf-8')
+        """Leer y validar la configuración una sola vez (check_config sale si es inválida)"""
+        self.config_path = default_config_path()
+        self.config = check_config(self.config_path)
+
+    @functools.cached_property
+    def response_cache(self):
+        """Caché HTTP opcional de la sección [Cache], creada al usar una fuente"""
+        if not self.config.getboolean('Cache', 'ENABLED', fallback=False):
+            return None
             
-            if not self.config.has_section('JIRA'):
-                raise ValueError("Sección [JIRA] no encontrada en configuración")
-            if not self.config.has_section('ValueEdge'):
-                raise ValueError("Sección [ValueEdge] no encontrada")
-                
-        except Exception as e:
-            logger.error(f"Error cargando configuración: {str(e)}")
-            messagebox.showerror("Error Fatal", "Configuración inválida")
-            sys.exit(1)
+        from core.httpCache import ResponseCache
+        try:
+            return ResponseCache(
+                self.config.get('Cache', 'DIR', fallback=os.path.join("output", "http_cache")),
+                ttl=self.config.getfloat('Cache', 'TTL_HOURS', fallback=24) * 3600,
+                max_bytes=int(self.config.getfloat('Cache', 'MAX_MB', fallback=512) * 1024 * 1024)
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(f"Caché HTTP deshabilitada: {str(e)}")
+            return None
 
     def create_main_menu(self):
         """Crear menú principal con nuevos estilos"""
@@ -214,12 +274,18 @@ class AutomationApp:
         ).pack(pady=10)
 
     def initialize_jira_extractor(self):
-        """Inicializar extractor JIRA con validación"""
+        """Inicializar extractor JIRA con validación; se reutiliza para todos los proyectos"""
+        if self.jira_extractor:
+            return
+            
+        from core.httpTransport import HttpTransport
+        from core.jiraExtractor import JiraExtractor
         try:
             self.jira_extractor = JiraExtractor(
                 self.config.get('JIRA', 'URL'),
                 self.config.get('JIRA', 'EMAIL'),
-                self.config.get('JIRA', 'API_TOKEN')
+                self.config.get('JIRA', 'API_TOKEN'),
+                transport=HttpTransport(cache=self.response_cache)
             )
             
             if not self.jira_extractor.check_connection():
@@ -241,7 +307,7 @@ class AutomationApp:
             
         option_window = tk.Toplevel(self.root)
         option_window.title(f"JIRA - {self.current_project}")
-        option_window.geometry("300x200")
+        option_window.geometry("300x250")
         option_window.configure(bg="#f0f0f0")
         
         tk.Label(
@@ -272,161 +338,362 @@ class AutomationApp:
             command=lambda: self.run_jira_extraction("all"),
             **button_style
         ).pack(pady=10)
+        
+        tk.Button(
+            option_window,
+            text="Sincronizar cambios",
+            command=lambda: self.run_jira_extraction("sync"),
+            **button_style
+        ).pack(pady=10)
 
-    def run_jira_extraction(self, mode):
-        """Ejecutar extracción JIRA con conversión automática"""
-        if not self.jira_extractor or not self.current_project:
+    def save_run_summary(self, name: str, summary: dict):
+        """Guardar el resumen de métricas junto a los perfiles, si están activos"""
+        if not self.profile_dir:
             return
-            
         try:
-            output_dir = os.path.join("output", "jira_issues", self.current_project)
-            os.makedirs(output_dir, exist_ok=True)
+            os.makedirs(self.profile_dir, exist_ok=True)
+            with open(os.path.join(self.profile_dir, f"{name}_{time.strftime('%Y%m%d_%H%M%S')}_metrics.json"), 'w', encoding='utf-8') as f:
+                json.dump(summary, f, indent=2, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"No se pudo guardar el resumen de métricas: {str(e)}")
+
+    def start_background(self, name: str, job, *args):
+        """Lanzar un trabajo en el hilo de trabajo con ventana de progreso, pausa y cancelación"""
+        if self.active_run is not None:
+            messagebox.showwarning("En curso", "Ya hay una extracción en curso", parent=self.root)
+            return
+            
+        run = BackgroundRun(name, job, *args)
+        
+        progress_window = tk.Toplevel(self.root)
+        progress_window.title("Progreso")
+        progress_window.geometry("300x130")
+        
+        progress_label = tk.Label(
+            progress_window,
+            text="Iniciando extracción...",
+            font=("Arial", 10)
+        )
+        progress_label.pack(pady=15)
+        
+        controls = tk.Frame(progress_window)
+        controls.pack()
+        
+        def toggle_pause():
+            if run.control.paused:
+                run.control.resume()
+                pause_button.config(text="Pausar")
+            else:
+                run.control.pause()
+                pause_button.config(text="Reanudar")
+                progress_label.config(text="En pausa")
+                
+        def cancel():
+            run.control.cancel()
+            progress_label.config(text="Cancelando...\nTerminando las descargas en curso")
+            pause_button.config(state=tk.DISABLED)
+            cancel_button.config(state=tk.DISABLED)
+            
+        pause_button = tk.Button(controls, text="Pausar", width=10, command=toggle_pause)
+        pause_button.pack(side=tk.LEFT, padx=5)
+        cancel_button = tk.Button(controls, text="Cancelar", width=10, command=cancel)
+        cancel_button.pack(side=tk.LEFT, padx=5)
+        progress_window.protocol("WM_DELETE_WINDOW", cancel)
+        
+        self.active_run = (run, progress_window, progress_label)
+        run.start()
+        self.root.after(PROGRESS_POLL_MS, self.poll_background)
+
+    def poll_background(self):
+        """Mostrar el último avance recibido y el resultado cuando el trabajo termina"""
+        run, progress_window, progress_label = self.active_run
+        latest = result = None
+        
+        # Se vacía la cola completa pero solo se repinta el último avance
+        while True:
+            try:
+                kind, payload = run.events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progreso":
+                latest = payload
+            else:
+                result = payload
+                
+        if result is None:
+            if latest and not run.control.paused and not run.control.cancelled:
+                progress_label.config(text=latest)
+            self.root.after(PROGRESS_POLL_MS, self.poll_background)
+            return
             
-            progress_window = tk.Toplevel(self.root)
-            progress_window.title("Progreso")
-            progress_window.geometry("300x100")
+        progress_window.destroy()
+        self.active_run = None
+        level, title, message = result
+        {
+            "info": messagebox.showinfo,
+            "warning": messagebox.showwarning,
+            "error": messagebox.showerror
+        }[level](title, message)
+
+    def run_jira_extraction(self, mode):
+        """Pedir los datos necesarios y lanzar la extracción JIRA en segundo plano"""
+        if not self.jira_extractor or not self.current_project:
+            return
             
-            progress_label = tk.Label(
-                progress_window,
-                text="Iniciando extracción...",
-                font=("Arial", 10)
+        issue_id = None
+        if mode == "single":
+            issue_number = simpledialog.askstring(
+                "Número de Issue", 
+                "Ingrese solo el número (ej: 123):",
+                parent=self.root
             )
-            progress_label.pack(pady=20)
-            self.root.update()
             
-            if mode == "all":
-                issues = self.jira_extractor.get_all_issues(self.current_project)
-                if not issues:
-                    messagebox.showinfo("Info", "No se encontraron issues")
-                    return
-                    
-                total = len(issues)
-                for idx, issue_id in enumerate(issues, 1):
-                    issue = self.jira_extractor.get_issue(issue_id)
-                    if issue:
-                        self.jira_extractor.save_issue(issue, output_dir)
-                    progress_label.config(
-                        text=f"Procesando {idx}/{total}\n{issue_id}"
-                    )
-                    progress_window.update()
-                    
-                messagebox.showinfo("Éxito", f"{total} issues extraídos")
+            if not (issue_number and issue_number.strip().isdigit()):
+                messagebox.showwarning("Error", "Número inválido")
+                return
+            issue_id = f"{self.current_project}-{issue_number.strip()}"
+            
+        self.start_background(f"jira_{mode}", self.jira_job, mode, self.current_project, issue_id)
+
+    @instrumented_run("jira")
+    def jira_job(self, mode, project, issue_id=None, *, control, report):
+        """Extracción JIRA con conversión automática (hilo de trabajo)"""
+        from core.checkpoint import CheckpointJournal
+        from core.pipeline import jira_source_name
+        
+        # save_issue agrega la carpeta del proyecto: <issues_root>/<PROYECTO>
+        issues_root = os.path.join("output", "jira_issues")
+        output_dir = os.path.join(issues_root, project)
+        os.makedirs(output_dir, exist_ok=True)
+        
+        features_dir = os.path.join("output", "features", "jira")
+        prefix = f"JIRA_{project}_"
+        # En modo completo los features se generan durante la extracción,
+        # salvo agrupados por módulo, que se arman con la carpeta completa
+        streamed = mode == "all" and not self.group_by_module
+        
+        if mode == "all":
+            def progress(position, total, issue_key):
+                report(f"Procesando {position}/{total}\n{issue_key}")
                 
-            elif mode == "single":
-                issue_number = simpledialog.askstring(
-                    "Número de Issue", 
-                    "Ingrese solo el número (ej: 123):",
-                    parent=self.root
+            journal = CheckpointJournal.for_run("jira", project)
+            pipeline = self.stream_pipeline(
+                features_dir, prefix, jira_source_name,
+                persist=lambda issue: self.jira_extractor.save_issue(issue, issues_root),
+                input_dir=output_dir
+            )
+            with pipeline:
+                extracted = self.jira_extractor.export_project(
+                    project, issues_root, journal=journal,
+                    progress=progress, sink=pipeline.submit, control=control
                 )
                 
-                if issue_number and issue_number.strip().isdigit():
-                    issue_id = f"{self.current_project}-{issue_number.strip()}"
-                    issue = self.jira_extractor.get_issue(issue_id)
-                    if issue:
-                        self.jira_extractor.save_issue(issue, output_dir)
-                        messagebox.showinfo("Éxito", f"Issue {issue_id} guardado")
-                    else:
-                        messagebox.showerror("Error", "Issue no encontrado")
-                else:
-                    messagebox.showwarning("Error", "Número inválido")
+            if not extracted:
+                return ("info", "Info", "No se encontraron issues")
+            result = self.stream_result(
+                pipeline, ("info", "Éxito", f"{extracted} issues extraídos")
+            )
+            
+        elif mode == "sync":
+            synced = 0
+            for issue in self.jira_extractor.sync_project(project, issues_root):
+                # Cancelar aquí cierra el generador sin mover la marca de sincronización
+                control.checkpoint()
+                synced += 1
+                report(f"Sincronizando {synced}\n{issue.get('key')}")
+                
+            result = ("info", "Éxito", f"{synced} issues nuevos o modificados")
             
-            # Conversión a Gherkin
-            self.convert_files(
+        else:
+            report(f"Descargando {issue_id}...")
+            issue = self.jira_extractor.get_issue(issue_id)
+            if not issue:
+                return ("error", "Error", "Issue no encontrado")
+            self.jira_extractor.save_issue(issue, issues_root)
+            result = ("info", "Éxito", f"Issue {issue_id} guardado")
+        
+        # Conversión a Gherkin
+        if not streamed:
+            control.checkpoint()
+            report("Convirtiendo a Gherkin...")
+            return self.convert_files(
                 input_dir=output_dir,
-                output_dir=os.path.join("output", "features", "jira"),
-                prefix=f"JIRA_{self.current_project}_"
-            )
-
-        except Exception as e:
-            logger.error(f"Error en extracción JIRA: {str(e)}")
-            messagebox.showerror("Error", f"Error crítico: {str(e)}")
-        finally:
-            if 'progress_window' in locals():
-                progress_window.destroy()
+                output_dir=features_dir,
+                prefix=prefix
+            ) or result
+        return result
 
     def run_valueedge_extraction(self, mode):
-        """Ejecutar extracción ValueEdge con conversión"""
-        try:
-            output_dir = os.path.join("output", "test_cases", self.current_workspace)
-            os.makedirs(output_dir, exist_ok=True)
-            
-            self.ve_extractor = ValueEdgeExtractor('secrets/secrets.ini')
-            self.ve_extractor.workspace = self.current_workspace
+        """Pedir los datos necesarios y lanzar la extracción ValueEdge en segundo plano"""
+        test_id = None
+        if mode == "single":
+            test_id = simpledialog.askstring(
+                "ID Caso", 
+                "Ingrese ID del caso (ej: 456):",
+                parent=self.root
+            )
             
-            if not self.ve_extractor.login():
-                messagebox.showerror("Error", "Falló login en ValueEdge")
+            if not (test_id and test_id.strip()):
                 return
+            test_id = test_id.strip()
+            
+        self.start_background(f"ve_{mode}", self.valueedge_job, mode, self.current_workspace, test_id)
+
+    @instrumented_run("ve")
+    def valueedge_job(self, mode, workspace, test_id=None, *, control, report):
+        """Extracción ValueEdge con conversión (hilo de trabajo)"""
+        from core.checkpoint import CheckpointJournal
+        from core.pipeline import ve_source_name
+        
+        output_dir = os.path.join("output", "test_cases", workspace)
+        os.makedirs(output_dir, exist_ok=True)
+        
+        if not self.connect_valueedge(workspace, report):
+            return ("error", "Error", "Falló login en ValueEdge")
+            
+        features_dir = os.path.join("output", "features", "ve")
+        prefix = f"VE_{workspace}_"
+        # En modo completo los features se generan durante la extracción,
+        # salvo agrupados por módulo, que se arman con la carpeta completa
+        streamed = mode == "all" and not self.group_by_module
+        
+        if mode == "all":
+            def progress(idx, total, test_id, ok):
+                report(f"Procesando {idx}/{total}\n{test_id}")
                 
-            if mode == "all":
-                test_ids = self.ve_extractor.get_all_test_cases()
-                if not test_ids:
-                    messagebox.showinfo("Info", "No hay casos de prueba")
-                    return
-                    
-                total = len(test_ids)
-                progress_window = tk.Toplevel(self.root)
-                progress_window.title("Progreso")
-                progress_window.geometry("300x100")
-                progress_label = tk.Label(progress_window, text="Iniciando...")
-                progress_label.pack(pady=20)
-                
-                for idx, test_id in enumerate(test_ids, 1):
-                    test_case = self.ve_extractor.get_test_case(test_id)
-                    self.ve_extractor.save_test_case(test_case, output_dir)
-                    progress_label.config(
-                        text=f"Procesando {idx}/{total}\n{test_id}"
-                    )
-                    progress_window.update()
-                    
-                progress_window.destroy()
-                messagebox.showinfo("Éxito", f"{total} casos extraídos")
-                
-            elif mode == "single":
-                test_id = simpledialog.askstring(
-                    "ID Caso", 
-                    "Ingrese ID del caso (ej: 456):",
-                    parent=self.root
+            journal = CheckpointJournal.for_run("ve", workspace)
+            pipeline = self.stream_pipeline(
+                features_dir, prefix, ve_source_name,
+                persist=lambda test_case: self.ve_extractor.save_test_case(test_case, output_dir),
+                input_dir=output_dir
+            )
+            with pipeline:
+                summary = self.ve_extractor.extract_all_test_cases(
+                    output_dir, progress=progress, journal=journal,
+                    sink=pipeline.submit, control=control
                 )
                 
-                if test_id and test_id.strip():
-                    test_case = self.ve_extractor.get_test_case(test_id.strip())
-                    if test_case:
-                        self.ve_extractor.save_test_case(test_case, output_dir)
-                        messagebox.showinfo("Éxito", "Caso guardado")
-                    else:
-                        messagebox.showerror("Error", "Caso no encontrado")
+            if not summary['total']:
+                return ("info", "Info", "No hay casos de prueba")
+                
+            result = self.stream_result(pipeline, (
+                "info",
+                "Éxito",
+                f"{summary['exitosos']} casos extraídos\n"
+                f"{summary['fallidos']} fallidos de {summary['total']}"
+            ))
             
-            # Conversión a Gherkin
-            self.convert_files(
+        else:
+            report(f"Descargando caso {test_id}...")
+            test_case = self.ve_extractor.get_test_case(test_id)
+            if not test_case:
+                return ("error", "Error", "Caso no encontrado")
+            self.ve_extractor.save_test_case(test_case, output_dir)
+            result = ("info", "Éxito", "Caso guardado")
+        
+        # Conversión a Gherkin
+        if not streamed:
+            control.checkpoint()
+            report("Convirtiendo a Gherkin...")
+            return self.convert_files(
                 input_dir=output_dir,
-                output_dir=os.path.join("output", "features", "ve"),
-                prefix=f"VE_{self.current_workspace}_"
+                output_dir=features_dir,
+                prefix=prefix
+            ) or result
+        return result
+
+    def connect_valueedge(self, workspace: str, report) -> bool:
+        """
+        Extractor de ValueEdge compartido entre ejecuciones y workspaces
+
+        Se crea y autentica en la primera ejecución; las siguientes solo
+        cambian de workspace. Si la sesión expira, el extractor la renueva
+        ante el primer 401.
+        """
+        if self.ve_extractor is None:
+            from core.httpTransport import HttpTransport
+            from core.valueEdgeExtractor import ValueEdgeExtractor
+            self.ve_extractor = ValueEdgeExtractor(
+                self.config_path,
+                transport=HttpTransport(verify=False, cache=self.response_cache)
             )
+            
+        self.ve_extractor.workspace = workspace
+        if self.ve_extractor.cookies:
+            return True
+            
+        report("Iniciando sesión en ValueEdge...")
+        return self.ve_extractor.login()
 
-        except Exception as e:
-            logger.error(f"Error en ValueEdge: {str(e)}")
-            messagebox.showerror("Error", f"Error crítico: {str(e)}")
+    def get_converter(self) -> "UltimateGherkinConverter":
+        """Única instancia del conversor para todas las ejecuciones"""
+        if self.converter is None:
+            from core.gherkinConverter import UltimateGherkinConverter
+            self.converter = UltimateGherkinConverter()
+        return self.converter
+
+    def stream_pipeline(self, output_dir: str, prefix: str, source_name, persist, input_dir: str) -> "FeaturePipeline":
+        """Pipeline que convierte cada registro extraído al vuelo y guarda su JSON (en input_dir) en paralelo"""
+        from core.pipeline import FeaturePipeline
+        if self.group_by_module:
+            return FeaturePipeline(None, source_name, persist=persist)
+            
+        converter = self.get_converter()
+        converter.output_dir = output_dir
+        converter.filename_prefix = prefix
+        return FeaturePipeline(converter, source_name, persist=persist, input_dir=input_dir)
+
+    def stream_result(self, pipeline: "FeaturePipeline", result):
+        """Resultado de una extracción en streaming, como advertencia si hubo features sin generar"""
+        errors = pipeline.summary["errores"]
+        if not errors:
+            return result
+        logger.warning(f"Conversión en streaming con {len(errors)} errores")
+        return (
+            "warning",
+            "Conversión incompleta",
+            f"{result[2]}\n{len(errors)} features no se pudieron generar "
+            "(se reintentan en la próxima ejecución, ver log)"
+        )
 
     def convert_files(self, input_dir: str, output_dir: str, prefix: str):
-        """Conversión a Gherkin con prefijo único"""
+        """
+        Conversión a Gherkin con prefijo único
+
+        Se ejecuta en el hilo de trabajo: no muestra diálogos y devuelve el
+        error a presentar (nivel, título, mensaje), o None si todo salió bien.
+        """
         try:
-            converter = UltimateGherkinConverter(input_dir, output_dir)
-            
-            # Monkey patch para nombres únicos
-            original_normalize = converter._normalize_filename
-            converter._normalize_filename = lambda x: prefix + original_normalize(x)
-            
-            converter.convert()
-            logger.info(f"Conversión exitosa: {input_dir} -> {output_dir}")
+            if self.group_by_module:
+                # Carpeta propia para no mezclarlos con los features por caso
+                output_dir = os.path.join(output_dir, "modulos")
+                summary = self.get_converter().convert_by_module(
+                    workers=None,
+                    input_dir=input_dir,
+                    output_dir=output_dir,
+                    filename_prefix=prefix
+                )
+            else:
+                summary = self.get_converter().convert(
+                    workers=None,
+                    incremental=True,
+                    input_dir=input_dir,
+                    output_dir=output_dir,
+                    filename_prefix=prefix
+                )
+            logger.info(
+                f"Conversión exitosa: {input_dir} -> {output_dir} | "
+                f"{summary['generados']} generados, {len(summary['errores'])} errores"
+            )
             
         except Exception as e:
             logger.error(f"Error en conversión: {str(e)}")
-            messagebox.showerror(
-                "Error de Conversión", 
-                f"No se pudieron generar features:\n{str(e)}"
-            )
+            return ("error", "Error de Conversión", f"No se pudieron generar features:\n{str(e)}")
+        return None
 
 if __name__ == "__main__":
+    # Necesario para el pool de conversión en el ejecutable empaquetado
+    multiprocessing.freeze_support()
     print("""
             ███████╗ ████████╗████████╗ ██████╗ ████████╗
             ██╔═══██╗   ██║   ██╔════╝ ██╔══██╗    ██║   
@@ -436,6 +703,9 @@ if __name__ == "__main__":
             ███████║ ████████║████████║╚═╝  ╚═╝ ████████║ v1.05
             </Alek>          
               """)  
-    check_config()
     app = AutomationApp()
+    # Medición de inicio de benchmarks/bench_startup.py, también con el ejecutable
+    probe_path = os.environ.get("DICAI_STARTUP_PROBE")
+    if probe_path:
+        app.root.after_idle(write_startup_probe, app.root, probe_path)
     app.root.mainloop()
\ No newline at end of file